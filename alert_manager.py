@@ -2,14 +2,16 @@
 Alert Manager - Smart notification system for +EV opportunities
 """
 
-import sqlite3
+import json
 import smtplib
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+import numpy as np
 import pandas as pd
 import streamlit as st
+from database import get_conn
 
 class AlertManager:
-    def __init__(self):
+    def __init__(self, conn=None):
         self.settings = {
             'sports': ['NBA'],
             'threshold': 0.05,
@@ -18,82 +20,140 @@ class AlertManager:
             'email': '',
             'push_token': ''
         }
-        self.conn = sqlite3.connect('betting_history.db', check_same_thread=False)
+        self.conn = conn if conn is not None else get_conn()
         self.create_tables()
+        self.load_settings()
     
     def create_tables(self):
         """Create alert tables if they don't exist"""
-        cursor = self.conn.cursor()
-        
-        # Custom alerts table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS custom_alerts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                player TEXT,
-                stat_type TEXT,
-                condition TEXT,
-                threshold REAL,
-                expiry TEXT,
-                active INTEGER DEFAULT 1,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Alert history table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS alert_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                alert_type TEXT,
-                sport TEXT,
-                player TEXT,
-                stat_type TEXT,
-                value REAL,
-                message TEXT,
-                sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        self.conn.commit()
+        with self.conn:
+            cursor = self.conn.cursor()
+            
+            # Custom alerts table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS custom_alerts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    player TEXT,
+                    stat_type TEXT,
+                    condition TEXT,
+                    threshold REAL,
+                    expiry TEXT,
+                    active INTEGER DEFAULT 1,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Alert history table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS alert_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    alert_type TEXT,
+                    sport TEXT,
+                    player TEXT,
+                    stat_type TEXT,
+                    value REAL,
+                    message TEXT,
+                    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Key/value settings table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS settings (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            ''')
+            
+            # Indexes for the active-alert and history lookups
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_alerts_active_expiry
+                ON custom_alerts (active, expiry, created_at DESC)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_history_sent_at
+                ON alert_history (sent_at DESC)
+            ''')
+    
+    def load_settings(self):
+        """Load saved alert settings"""
+        with self.conn:
+            cursor = self.conn.cursor()
+            cursor.execute('SELECT value FROM settings WHERE key = ?', ('alert_settings',))
+            row = cursor.fetchone()
+        
+        if row:
+            try:
+                self.settings.update(json.loads(row[0]))
+            except ValueError as e:
+                print(f"Error loading alert settings: {e}")
     
     def update_settings(self, settings):
         """Update alert settings"""
         self.settings.update(settings)
         # Save to database
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT OR REPLACE INTO settings (key, value)
-            VALUES (?, ?)
-        ''', ('alert_settings', str(self.settings)))
-        self.conn.commit()
+        with self.conn:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO settings (key, value)
+                VALUES (?, ?)
+            ''', ('alert_settings', json.dumps(self.settings)))
     
-    def add_custom_alert(self, player=None, stat_type=None, condition=None, 
-                        threshold=0.05, expiry=None):
-        """Add a custom alert rule"""
-        cursor = self.conn.cursor()
+    def _normalize_expiry(self, expiry):
+        """Store expiry as an ISO string (default 30 days out)"""
         if expiry is None:
-            expiry = (datetime.now() + timedelta(days=30)).isoformat()
-        elif isinstance(expiry, datetime):
-            expiry = expiry.isoformat()
-        
-        cursor.execute('''
-            INSERT INTO custom_alerts 
-            (player, stat_type, condition, threshold, expiry, active)
-            VALUES (?, ?, ?, ?, ?, 1)
-        ''', (player, stat_type, condition, threshold, expiry))
-        
-        self.conn.commit()
-        return cursor.lastrowid
+            return (datetime.now() + timedelta(days=30)).isoformat()
+        elif isinstance(expiry, date):
+            return expiry.isoformat()
+        return expiry
+    
+    def add_custom_alert(self, player=None, stat_type=None, condition=None, 
+                        threshold=0.05, expiry=None, return_id=False):
+        """Add a custom alert rule (returns the new id only when return_id=True)"""
+        with self.conn:
+            cursor = self.conn.cursor()
+            expiry = self._normalize_expiry(expiry)
+            
+            cursor.execute('''
+                INSERT INTO custom_alerts 
+                (player, stat_type, condition, threshold, expiry, active)
+                VALUES (?, ?, ?, ?, ?, 1)
+            ''', (player, stat_type, condition, threshold, expiry))
+        if return_id:
+            return cursor.lastrowid
+    
+    def add_custom_alerts_bulk(self, alerts):
+        """Add many custom alert rules in a single transaction"""
+        rows = [(
+            a.get('player'),
+            a.get('stat_type'),
+            a.get('condition'),
+            a.get('threshold', 0.05),
+            self._normalize_expiry(a.get('expiry'))
+        ) for a in alerts]
+        
+        if not rows:
+            return
+        
+        with self.conn:
+            self.conn.executemany('''
+                INSERT INTO custom_alerts 
+                (player, stat_type, condition, threshold, expiry, active)
+                VALUES (?, ?, ?, ?, ?, 1)
+            ''', rows)
     
     def get_active_alerts(self):
         """Get all active custom alerts"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT * FROM custom_alerts 
-            WHERE active = 1 AND date(expiry) >= date('now')
-            ORDER BY created_at DESC
-        ''')
-        
-        alerts = cursor.fetchall()
+        with self.conn:
+            cursor = self.conn.cursor()
+            # expiry is stored as an ISO string, so compare it directly to keep the index usable
+            cursor.execute('''
+                SELECT * FROM custom_alerts 
+                WHERE active = 1 AND expiry >= ?
+                ORDER BY created_at DESC, id
+            ''', (date.today().isoformat(),))
+            
+            alerts = cursor.fetchall()
         return [{
             'id': a[0],
             'player': a[1],
@@ -111,74 +171,115 @@ class AlertManager:
         if ev_data.empty:
             return triggered
         
-        active_alerts = self.get_active_alerts()
+        alerts = self.get_active_alerts()
+        if not alerts:
+            return triggered
         
-        for alert in active_alerts:
-            # Filter data based on alert criteria
-            filtered = ev_data.copy()
-            
+        # Match in memory: the connection is shared across sessions, so no temp tables
+        players = ev_data['player'].to_numpy(dtype=object)
+        stat_types = ev_data['stat_type'].to_numpy(dtype=object)
+        directions = ev_data['direction'].to_numpy(dtype=object)
+        evs = ev_data['ev'].to_numpy(dtype=float)
+        sports = ev_data['sport'].to_numpy(dtype=object)
+        
+        # Record triggered alerts
+        history_rows = []
+        for alert in alerts:
+            # Empty player/stat_type/condition/threshold act as wildcards
+            mask = np.ones(len(evs), dtype=bool)
             if alert['player']:
-                filtered = filtered[filtered['player'] == alert['player']]
-            
+                mask &= players == alert['player']
             if alert['stat_type']:
-                filtered = filtered[filtered['stat_type'] == alert['stat_type']]
-            
-            if alert['condition'] and alert['condition'] != 'Any':
-                if alert['condition'] == 'OVER':
-                    filtered = filtered[filtered['direction'] == 'OVER']
-                elif alert['condition'] == 'UNDER':
-                    filtered = filtered[filtered['direction'] == 'UNDER']
-            
-            # Check threshold
+                mask &= stat_types == alert['stat_type']
+            if alert['condition'] in ('OVER', 'UNDER'):
+                mask &= directions == alert['condition']
             if alert['threshold']:
-                filtered = filtered[filtered['ev'] >= alert['threshold']]
+                mask &= evs >= alert['threshold']
             
-            # Record triggered alerts
-            for _, prop in filtered.iterrows():
+            for pos in np.flatnonzero(mask):
+                player, stat_type, ev, sport = players[pos], stat_types[pos], float(evs[pos]), sports[pos]
                 triggered.append({
                     'alert_id': alert['id'],
-                    'player': prop['player'],
-                    'stat_type': prop['stat_type'],
-                    'ev': prop['ev'],
-                    'message': f"{prop['player']} {prop['stat_type']} EV: {prop['ev']:.1%}"
+                    'player': player,
+                    'stat_type': stat_type,
+                    'ev': ev,
+                    'message': f"{player} {stat_type} EV: {ev:.1%}"
                 })
-                
-                # Log to history
-                self.log_alert('custom', prop['sport'], prop['player'], 
-                              prop['stat_type'], prop['ev'], 
-                              f"Alert triggered: {prop['player']}")
+                history_rows.append(('custom', sport, player, stat_type, ev,
+                                     f"Alert triggered: {player}"))
+        
+        # Log to history in a single transaction
+        self.log_alerts_bulk(history_rows)
         
         return triggered
     
     def log_alert(self, alert_type, sport, player, stat_type, value, message):
         """Log alert to history"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO alert_history (alert_type, sport, player, stat_type, value, message)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (alert_type, sport, player, stat_type, value, message))
-        self.conn.commit()
+        with self.conn:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                INSERT INTO alert_history (alert_type, sport, player, stat_type, value, message)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (alert_type, sport, player, stat_type, value, message))
     
-    def get_alert_history(self, days=7):
-        """Get alert history"""
-        query = '''
+    def log_alerts_bulk(self, rows):
+        """Log many alerts to history with one commit"""
+        if not rows:
+            return
+        
+        with self.conn:
+            self.conn.executemany('''
+                INSERT INTO alert_history (alert_type, sport, player, stat_type, value, message)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', rows)
+    
+    def get_alert_history(self, days=7, limit=100, before=None):
+        """Get one page of alert history, newest first
+        
+        Pass (sent_at, id) of the last row as `before` to fetch the next page.
+        """
+        # days is coerced to int, so the modifier is a safe constant for the planner
+        query = f'''
             SELECT * FROM alert_history 
-            WHERE sent_at >= datetime('now', '-' || ? || ' days')
-            ORDER BY sent_at DESC
+            WHERE sent_at >= datetime('now', '-{int(days)} days')
         '''
-        return pd.read_sql_query(query, self.conn, params=[days])
+        params = []
+        
+        if before is not None:
+            before_sent_at, before_id = before
+            query += " AND (sent_at < ? OR (sent_at = ? AND id < ?))"
+            params.extend([before_sent_at, before_sent_at, int(before_id)])
+        
+        query += " ORDER BY sent_at DESC, id DESC LIMIT ?"
+        params.append(int(limit))
+        
+        with self.conn:
+            cursor = self.conn.cursor()
+            cursor.execute(query, params)
+            columns = [d[0] for d in cursor.description]
+            return pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+    
+    def count_alert_history(self, days=7):
+        """Count alerts sent in the last N days"""
+        with self.conn:
+            cursor = self.conn.cursor()
+            cursor.execute(f'''
+                SELECT COUNT(*) FROM alert_history
+                WHERE sent_at >= datetime('now', '-{int(days)} days')
+            ''')
+            return cursor.fetchone()[0]
     
     def clear_all_alerts(self):
         """Deactivate all custom alerts"""
-        cursor = self.conn.cursor()
-        cursor.execute('UPDATE custom_alerts SET active = 0')
-        self.conn.commit()
+        with self.conn:
+            cursor = self.conn.cursor()
+            cursor.execute('UPDATE custom_alerts SET active = 0')
     
     def delete_alert(self, alert_id):
         """Delete a specific alert"""
-        cursor = self.conn.cursor()
-        cursor.execute('DELETE FROM custom_alerts WHERE id = ?', (alert_id,))
-        self.conn.commit()
+        with self.conn:
+            cursor = self.conn.cursor()
+            cursor.execute('DELETE FROM custom_alerts WHERE id = ?', (alert_id,))
     
     def send_test_alert(self):
         """Send a test alert to verify settings"""
@@ -7,6 +7,7 @@ iPad-Optimized Version - All 11 Features Included - FULLY FIXED with ALL FEATURE
 # PAGE CONFIGURATION - MUST BE FIRST!
 # ============================================
 import streamlit as st
+import streamlit.components.v1 as components
 st.set_page_config(
     page_title="PrizePicks +EV Pro",
     page_icon="🏆",
@@ -18,7 +19,6 @@ st.set_page_config(
 # ALL OTHER IMPORTS GO AFTER set_page_config
 # ============================================
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import numpy as np
@@ -27,57 +27,109 @@ import json
 import sqlite3
 from time import sleep
 import os
+import functools
+
+# Public URL used by the share links
+APP_URL = "https://prizepicks-ipad-app.streamlit.app"
+
+# Timezone used for the data day and the sidebar clock
+CENTRAL = pytz.timezone('America/Chicago')
+
+# Month names for the calendar selector
+MONTH_NAMES = tuple(datetime(2000, month, 1).strftime('%B') for month in range(1, 13))
+
+# Bet tracker time periods and their selectbox labels
+PERIOD_LABELS = {days: f"Last {days} days" for days in (7, 30, 90, 365)}
 
 # Import core modules with error handling
 try:
     from ev_calculator import calculate_ev, calculate_parlay_probability
     from correlation_analyzer import calculate_correlation_penalty, get_correlation_warning
     from prizepicks_scraper import get_daily_data
-    from sports_config import SPORT_DISPLAY_NAMES, SPORT_STATS
+    from sports_config import SPORT_KEYS, SPORT_LABELS, SPORT_STATS, DEFAULT_STATS
+    from ipad_styles import IPAD_CSS, DARK_CSS
+    from ui_helpers import display_large_dataframe
     core_modules_available = True
 except ImportError as e:
     st.error(f"Error importing core modules: {e}")
     st.stop()
 
 # Initialize classes with error handling
+# Shared managers are cached with st.cache_resource; per-user ones live in st.session_state
 try:
     from bet_tracker import BetTracker
-    bet_tracker = BetTracker()
+    from database import get_conn
+    
+    @st.cache_resource
+    def get_bet_tracker():
+        return BetTracker(get_conn())
+    
+    bet_tracker = get_bet_tracker()
 except ImportError:
     bet_tracker = None
     st.warning("Bet Tracker module not available - some features disabled")
 
 try:
     from bankroll_manager import BankrollManager
-    bankroll_mgr = BankrollManager(1000)
+    
+    def get_bankroll_mgr():
+        # The bankroll belongs to the user, so each session keeps its own manager
+        if 'bankroll_mgr' not in st.session_state:
+            st.session_state['bankroll_mgr'] = BankrollManager(1000)
+        return st.session_state['bankroll_mgr']
+    
+    bankroll_mgr = get_bankroll_mgr()
 except ImportError:
     bankroll_mgr = None
     st.warning("Bankroll Manager module not available - some features disabled")
 
 try:
     from bump_detector import BumpDetector
-    bump_detector = BumpDetector()
+    
+    @st.cache_resource
+    def get_bump_detector():
+        return BumpDetector()
+    
+    bump_detector = get_bump_detector()
 except ImportError:
     bump_detector = None
     st.warning("Bump Detector module not available - some features disabled")
 
 try:
     from arbitrage_scanner import ArbitrageScanner
-    arb_scanner = ArbitrageScanner()
+    
+    @st.cache_resource
+    def get_arb_scanner():
+        return ArbitrageScanner()
+    
+    arb_scanner = get_arb_scanner()
 except ImportError:
     arb_scanner = None
     st.warning("Arbitrage Scanner module not available - some features disabled")
 
 try:
     from ios_widget import iOSWidget
-    ios_widget = iOSWidget()
+    
+    def get_ios_widget():
+        # Widget data is the user's own picks, so each session keeps its own instance
+        if 'ios_widget' not in st.session_state:
+            st.session_state['ios_widget'] = iOSWidget()
+        return st.session_state['ios_widget']
+    
+    ios_widget = get_ios_widget()
 except ImportError:
     ios_widget = None
     st.warning("iOS Widget module not available - some features disabled")
 
 try:
     from alert_manager import AlertManager
-    alert_mgr = AlertManager()
+    from database import get_conn
+    
+    @st.cache_resource
+    def get_alert_mgr():
+        return AlertManager(get_conn())
+    
+    alert_mgr = get_alert_mgr()
 except ImportError:
     alert_mgr = None
     st.warning("Alert Manager module not available - some features disabled")
@@ -85,56 +137,96 @@ except ImportError:
 # Initialize new managers with error handling
 try:
     from ml_predictor import MLPredictor
-    ml_predictor = MLPredictor()
+    
+    @st.cache_resource
+    def get_ml_predictor():
+        return MLPredictor()
+    
+    ml_predictor = get_ml_predictor()
 except ImportError:
     ml_predictor = None
     st.warning("ML Predictor module not available - some features disabled")
 
 try:
     from push_notifications import PushNotificationManager
-    push_notifications = PushNotificationManager()
+    
+    @st.cache_resource
+    def get_push_notifications():
+        return PushNotificationManager()
+    
+    push_notifications = get_push_notifications()
 except ImportError:
     push_notifications = None
     st.warning("Push Notifications module not available - some features disabled")
 
 try:
     from multi_user import MultiUserManager
-    multi_user = MultiUserManager()
+    
+    @st.cache_resource
+    def get_multi_user():
+        return MultiUserManager()
+    
+    multi_user = get_multi_user()
 except ImportError:
     multi_user = None
     st.warning("Multi-User module not available - some features disabled")
 
 try:
     from calendar_view import CalendarView
-    calendar_view = CalendarView(bet_tracker) if bet_tracker else None
+    
+    @st.cache_resource
+    def get_calendar_view(_bet_tracker):
+        return CalendarView(_bet_tracker)
+    
+    calendar_view = get_calendar_view(bet_tracker) if bet_tracker else None
 except ImportError:
     calendar_view = None
     st.warning("Calendar View module not available - some features disabled")
 
 try:
     from public_leaderboard import PublicLeaderboard
-    leaderboard = PublicLeaderboard(bet_tracker, multi_user) if bet_tracker and multi_user else None
+    
+    @st.cache_resource
+    def get_leaderboard(_bet_tracker, _multi_user):
+        return PublicLeaderboard(_bet_tracker, _multi_user)
+    
+    leaderboard = get_leaderboard(bet_tracker, multi_user) if bet_tracker and multi_user else None
 except ImportError:
     leaderboard = None
     st.warning("Leaderboard module not available - some features disabled")
 
 try:
     from syndicate import SyndicateManager
-    syndicate = SyndicateManager(multi_user) if multi_user else None
+    
+    @st.cache_resource
+    def get_syndicate(_multi_user):
+        return SyndicateManager(_multi_user)
+    
+    syndicate = get_syndicate(multi_user) if multi_user else None
 except ImportError:
     syndicate = None
     st.warning("Syndicate module not available - some features disabled")
 
 try:
     from premium_subscription import PremiumManager
-    premium = PremiumManager()
+    
+    @st.cache_resource
+    def get_premium():
+        return PremiumManager()
+    
+    premium = get_premium()
 except ImportError:
     premium = None
     st.warning("Premium Subscription module not available - some features disabled")
 
 try:
     from live_betting import LiveBettingManager
-    live_betting = LiveBettingManager()
+    
+    @st.cache_resource
+    def get_live_betting():
+        return LiveBettingManager()
+    
+    live_betting = get_live_betting()
 except ImportError:
     live_betting = None
     st.warning("Live Betting module not available - some features disabled")
@@ -142,136 +234,7 @@ except ImportError:
 # ============================================
 # IPAD-OPTIMIZED CSS
 # ============================================
-st.markdown("""
-<style>
-    /* Bigger touch targets for iPad */
-    .stButton > button {
-        min-height: 55px;
-        font-size: 18px !important;
-        border-radius: 15px !important;
-        margin: 8px 0px;
-        font-weight: 600 !important;
-    }
-    
-    /* Better spacing for touch */
-    .stSelectbox, .stSlider, .stRadio {
-        margin-bottom: 25px;
-    }
-    
-    /* Make sliders easier to grab */
-    .stSlider div[data-baseweb="slider"] {
-        padding-top: 15px;
-        padding-bottom: 15px;
-    }
-    
-    .stSlider .thumb {
-        width: 28px !important;
-        height: 28px !important;
-        background-color: #FF4B4B !important;
-        border: 3px solid white !important;
-    }
-    
-    /* Card-like containers */
-    .stApp .block-container {
-        padding-left: 1.2rem;
-        padding-right: 1.2rem;
-        padding-top: 1.5rem;
-    }
-    
-    /* Metric cards */
-    div[data-testid="stMetric"] {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 20px;
-        padding: 20px 15px;
-        box-shadow: 0 6px 12px rgba(0,0,0,0.1);
-        margin: 10px 0px;
-    }
-    
-    div[data-testid="stMetric"] label {
-        color: rgba(255,255,255,0.9) !important;
-        font-size: 16px !important;
-        font-weight: 500 !important;
-    }
-    
-    div[data-testid="stMetric"] div[data-testid="stMetricValue"] {
-        color: white !important;
-        font-size: 36px !important;
-        font-weight: 700 !important;
-        line-height: 1.2 !important;
-    }
-    
-    /* Data tables */
-    .stDataFrame {
-        font-size: 15px;
-    }
-    
-    .stDataFrame div[data-testid="stDataFrame"] {
-        max-height: 450px;
-        overflow-y: auto;
-        -webkit-overflow-scrolling: touch;
-        border-radius: 15px;
-        border: 1px solid #e0e0e0;
-    }
-    
-    /* Bottom padding */
-    .main > div {
-        padding-bottom: 120px;
-    }
-    
-    /* Hide hamburger menu */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    
-    /* Tabs styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        border-radius: 15px 15px 0 0;
-        padding: 15px 25px;
-        font-size: 16px;
-        font-weight: 600;
-    }
-    
-    /* Risk badges */
-    .risk-high {
-        background-color: #ff4444;
-        color: white;
-        padding: 4px 8px;
-        border-radius: 12px;
-        font-size: 12px;
-        font-weight: bold;
-    }
-    
-    .risk-medium {
-        background-color: #ff8800;
-        color: white;
-        padding: 4px 8px;
-        border-radius: 12px;
-        font-size: 12px;
-        font-weight: bold;
-    }
-    
-    .risk-low {
-        background-color: #ffbb33;
-        color: black;
-        padding: 4px 8px;
-        border-radius: 12px;
-        font-size: 12px;
-        font-weight: bold;
-    }
-    
-    /* Share button styling */
-    .share-box {
-        background-color: #f0f2f6;
-        border-radius: 10px;
-        padding: 15px;
-        margin: 10px 0px;
-        font-family: monospace;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(IPAD_CSS, unsafe_allow_html=True)
 
 # ============================================
 # TITLE SECTION
@@ -286,78 +249,257 @@ with st.sidebar:
     st.markdown("## ⚙️ Settings")
     
     # Sport selection
-    sport_options = list(SPORT_DISPLAY_NAMES.keys())
-    sport_display = list(SPORT_DISPLAY_NAMES.values())
-    
     selected_sport_index = st.selectbox(
         "🎯 Select Sport",
-        range(len(sport_options)),
-        format_func=lambda x: sport_display[x],
+        range(len(SPORT_KEYS)),
+        format_func=SPORT_LABELS.__getitem__,
         index=0,
         key="sport_selector"
     )
-    selected_sport = sport_options[selected_sport_index]
+    selected_sport = SPORT_KEYS[selected_sport_index]
     
-    # Advanced Filters
-    with st.expander("🔍 Advanced Filters"):
-        stat_types = SPORT_STATS.get(selected_sport, ["Points", "Rebounds", "Assists"])
-        selected_stats = st.multiselect("Stat Types", stat_types, default=stat_types)
+    # Filter widgets sit in a form so slider drags don't rerun the app until submitted
+    with st.form("parlay_settings", border=False):
+        # Advanced Filters
+        with st.expander("🔍 Advanced Filters"):
+            stat_types = SPORT_STATS.get(selected_sport, DEFAULT_STATS)
+            selected_stats = st.multiselect("Stat Types", stat_types, default=stat_types)
+            
+            min_odds = st.slider("Minimum Odds", -500, 500, -200, 50, format="%d")
+            max_odds = st.slider("Maximum Odds", -500, 500, 200, 50, format="%d")
+            
+            exclude_bump_risk = st.checkbox("Exclude High Bump Risk", value=True)
         
-        min_odds = st.slider("Minimum Odds", -500, 500, -200, 50, format="%d")
-        max_odds = st.slider("Maximum Odds", -500, 500, 200, 50, format="%d")
+        # Parlay settings
+        st.markdown("### 📊 Parlay Size")
+        num_legs = st.select_slider("Picks", options=[2, 3, 4, 5, 6], value=6)
         
-        exclude_bump_risk = st.checkbox("Exclude High Bump Risk", value=True)
-    
-    # Parlay settings
-    st.markdown("### 📊 Parlay Size")
-    num_legs = st.select_slider("Picks", options=[2, 3, 4, 5, 6], value=6)
-    
-    # EV threshold
-    st.markdown("### 💰 Minimum Value")
-    min_ev = st.slider("EV Threshold", 0, 20, 5, 1) / 100
+        # EV threshold
+        st.markdown("### 💰 Minimum Value")
+        min_ev = st.slider("EV Threshold", 0, 20, 5, 1) / 100
+        
+        # Main action button
+        analyze_clicked = st.form_submit_button("🔍 FIND BEST PARLAY", use_container_width=True, type="primary")
     
     st.divider()
     
     # Dark mode
     dark_mode = st.toggle("🌙 Dark Mode", value=False)
     
+    # Streamlit drops the element on the first rerun it isn't emitted, so toggling off cleans up
     if dark_mode:
-        st.markdown("""
-        <style>
-            .stApp, .main > div { background-color: #0e1117; color: #ffffff; }
-            h1, h2, h3, p, li { color: #ffffff !important; }
-            section[data-testid="stSidebar"] { background-color: #1a1f2c !important; }
-            .stMarkdown, .stCaption { color: #e0e0e0 !important; }
-        </style>
-        """, unsafe_allow_html=True)
-    
-    st.divider()
-    
-    # Main action button
-    analyze_clicked = st.button("🔍 FIND BEST PARLAY", use_container_width=True, type="primary")
+        st.markdown(DARK_CSS, unsafe_allow_html=True)
     
     st.divider()
     
     # Data status
-    central = pytz.timezone('America/Chicago')
-    current_time = datetime.now(central).strftime("%I:%M %p %Z")
+    current_time = datetime.now(CENTRAL).strftime("%I:%M %p %Z")
     st.caption(f"🔄 Last update: {current_time}")
 
 # ============================================
 # LOAD DATA FUNCTION
 # ============================================
-@st.cache_data(ttl=300)
-def load_data(sport):
+def _compact_frame(df):
+    """Store repeated labels as categoricals (lines stay float64 so they print and store exactly)"""
+    df = df.copy()
+    for col in ['player', 'stat_type', 'sport']:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+DATA_CACHE_DIR = '.cache'
+DATA_CACHE_TTL = 300
+
+def _fetch_daily_data(sport):
+    """Fetch daily data, reusing the on-disk parquet snapshot while it is fresh"""
+    day = datetime.now(CENTRAL).strftime('%Y%m%d')
+    base = os.path.join(DATA_CACHE_DIR, f"{sport}_{day}")
+    pp_path, market_path = f"{base}_pp.parquet", f"{base}_market.parquet"
+    
+    try:
+        if os.path.exists(pp_path) and os.path.exists(market_path):
+            age = datetime.now().timestamp() - min(os.path.getmtime(pp_path), os.path.getmtime(market_path))
+            if age < DATA_CACHE_TTL:
+                pp_data, market_data = pd.read_parquet(pp_path), pd.read_parquet(market_path)
+                # The scraper's own fetch status is skipped on this path, so report where the props came from
+                st.sidebar.info(f"📦 Loaded {len(pp_data)} {sport} props from cache (age {int(age)}s)")
+                return pp_data, market_data
+    except Exception as e:
+        print(f"Error reading data cache: {e}")
+    
+    pp_data, market_data = get_daily_data(sport)
+    
     try:
-        pp_data, market_data = get_daily_data(sport)
-        return pp_data, market_data
+        os.makedirs(DATA_CACHE_DIR, exist_ok=True)
+        pp_data.to_parquet(pp_path, compression='zstd')
+        market_data.to_parquet(market_path, compression='zstd')
+    except Exception as e:
+        print(f"Error writing data cache: {e}")
+    
+    return pp_data, market_data
+
+@st.cache_resource(ttl=300)
+def _load_data_cached(sport):
+    # cache_resource hands back the same frames instead of pickling them on every hit
+    pp_data, market_data = _fetch_daily_data(sport)
+    pp_data, market_data = _compact_frame(pp_data), _compact_frame(market_data)
+    
+    # EV is derived alongside the snapshot, so reruns never hash the frames to look it up
+    ev_data = calculate_ev(pp_data, market_data)
+    if not ev_data.empty:
+        # Chart label (last name), derived once per snapshot instead of on every render
+        ev_data['player_short'] = ev_data['player'].str.rsplit(n=1).str[-1]
+    # Bump risk is tagged once here so every tab can filter or count it with a mask
+    bump_warnings = pd.DataFrame()
+    if bump_detector:
+        ev_data = bump_detector.annotate(ev_data)
+        # The warnings table only depends on the snapshot, so tab4 never has to hash the frame for it
+        if not ev_data.empty:
+            bump_warnings = bump_detector.get_bump_warning(ev_data)
+    
+    return pp_data, market_data, ev_data, bump_warnings
+
+def get_ev(sport):
+    """Load a sport's props and market odds plus their EV and bump-warning frames (computed once per snapshot)"""
+    try:
+        frames = _load_data_cached(sport)
+        # Shallow copies keep callers from mutating the shared cached frames
+        return tuple(df.copy(deep=False) for df in frames)
     except Exception as e:
         st.error(f"Error loading data: {e}")
-        return pd.DataFrame(), pd.DataFrame()
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+
+def _hash_frame(df):
+    return pd.util.hash_pandas_object(df, index=True).values.tobytes()
+
+@st.cache_data(ttl=300, show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
+def cached_correlation(picks):
+    """Correlation penalty and same-team warning for a set of picks"""
+    return calculate_correlation_penalty(picks), get_correlation_warning(picks)
+
+def _bets_version():
+    # Row-change counter of the shared connection; it moves on every write, which invalidates the caches below
+    return bet_tracker.conn.total_changes
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_bets(sport, days, version):
+    """Bet history for a filter, reused across reruns until the database changes"""
+    return bet_tracker.get_bets(sport=sport, days=days)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_sport_stats(sport, days, version):
+    """Per-sport totals for completed bets, aggregated by SQLite"""
+    return bet_tracker.get_sport_stats(sport=sport, days=days)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_daily_pnl(sport, days, version):
+    """Per-day profit and bet counts, aggregated by SQLite"""
+    return bet_tracker.get_daily_pnl(sport=sport, days=days)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_bets_csv(sport, days, version):
+    """CSV export of the bet history, serialized once per filter and database version"""
+    return cached_bets(sport, days, version).to_csv(index=False)
+
+def _alerts_version():
+    # Same counter as _bets_version, read through the alert manager's handle on the shared connection
+    return alert_mgr.conn.total_changes
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_alert_history(days, limit, before, version):
+    """One keyset page of alert history, reused across reruns until the database changes"""
+    return alert_mgr.get_alert_history(days=days, limit=limit, before=before)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_alert_count(days, version):
+    """Alerts sent in the last N days, for the history badge"""
+    return alert_mgr.count_alert_history(days=days)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_bet_statistics(days, version):
+    """Performance metrics for a period, reused across reruns until the database changes"""
+    return bet_tracker.get_statistics(days=days)
+
+@functools.lru_cache(maxsize=1)
+def _px():
+    # plotly.express is only imported once a chart is actually built
+    import plotly.express as px
+    return px
+
+@st.cache_data
+def sample_widget_data():
+    """Sample props for the widget preview when no analysis has run"""
+    sample_ev = pd.DataFrame({
+        'player': ['LeBron James', 'Stephen Curry', 'Giannis Antetokounmpo', 'Luka Doncic', 'Joel Embiid'],
+        'stat_type': ['Points', '3PM', 'Rebounds', 'PRA', 'Points'],
+        'line': [25.5, 3.5, 12.5, 44.5, 31.5],
+        'ev': [0.08, 0.07, 0.06, 0.055, 0.05],
+        'is_positive': [True, True, True, True, True]
+    })
+    sample_pp = pd.DataFrame({'player': ['LeBron', 'Curry', 'Giannis', 'Luka', 'Embiid']})
+    return sample_ev, sample_pp
+
+# Figures are built with graph_objects, cached as plain dicts and rebuilt with go.Figure on each render
+def _colored_bar(x, y, text, title, y_title):
+    """Bar chart coloured on an RdYlGn scale by its own values"""
+    fig = go.Figure(go.Bar(
+        x=x,
+        y=y,
+        text=text,
+        textposition='outside',
+        marker=dict(color=y, colorscale='RdYlGn', showscale=True, colorbar=dict(title=y_title))
+    ))
+    fig.update_layout(title=title, xaxis_title='sport', yaxis_title=y_title)
+    return fig
+
+@st.cache_data(ttl=300, show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
+def build_sport_winrate_fig(sport_stats):
+    fig = _colored_bar(
+        sport_stats['sport'].astype(str),
+        sport_stats['win_rate'],
+        [f"{x}%" for x in sport_stats['win_rate'].tolist()],
+        'Win Rate by Sport',
+        'win_rate'
+    )
+    fig.update_layout(yaxis_range=[0, 100])
+    return fig.to_dict()
+
+@st.cache_data(ttl=300, show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
+def build_sport_profit_fig(sport_stats):
+    fig = _colored_bar(
+        sport_stats['sport'].astype(str),
+        sport_stats['profit'],
+        [f"${x:.0f}" for x in sport_stats['profit'].tolist()],
+        'Profit/Loss by Sport',
+        'profit'
+    )
+    return fig.to_dict()
+
+@st.cache_data(ttl=300, show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
+def build_ev_bar_fig(chart_data):
+    fig = _px().bar(chart_data, x='player_short', y='ev', color='ev',
+                    color_continuous_scale='RdYlGn', title="Top 15 Props by EV")
+    fig.update_layout(xaxis_tickangle=-45, height=400, yaxis_tickformat='.0%')
+    return fig.to_dict()
+
+@st.cache_data(ttl=300, show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
+def build_weekly_fig(weekly_stats):
+    fig = go.Figure(go.Scatter(
+        x=weekly_stats['date'],
+        y=weekly_stats['profit'],
+        mode='lines+markers'
+    ))
+    fig.update_layout(title='Weekly Profit/Loss', xaxis_title='date', yaxis_title='profit')
+    fig.add_hline(y=0, line_dash="dash", line_color="red")
+    return fig.to_dict()
 
 # ============================================
 # MAIN TABS
 # ============================================
+# Loaded once per rerun and shared by every tab below
+with st.spinner(f"Loading {selected_sport} data..."):
+    pp_data, market_data, ev_data, bump_warnings = get_ev(selected_sport)
+
 tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10, tab11 = st.tabs([
     "🎯 Parlay Builder", "📊 Bet Tracker", "💰 Bankroll", "⚠️ Bump Detector",
     "🔄 Arbitrage", "🔔 Alerts", "📱 Widget", "🤖 AI Picks", "📅 Calendar",
@@ -371,48 +513,42 @@ with tab1:
     # Preview section
     st.subheader("👀 Today's Available Props")
     
-    with st.spinner(f"Loading {selected_sport} data..."):
-        pp_data, market_data = load_data(selected_sport)
-        
-        if not pp_data.empty:
-            preview_df = pp_data[['player', 'line', 'stat_type']].head(10).copy()
-            preview_df.columns = ['Player', 'Line', 'Stat Type']
-            st.success(f"✅ Showing {len(pp_data)} real {selected_sport} props")
-            st.dataframe(preview_df, use_container_width=True, height=300)
+    if not pp_data.empty:
+        preview_df = pp_data[['player', 'line', 'stat_type']].head(10).copy()
+        preview_df.columns = ['Player', 'Line', 'Stat Type']
+        st.success(f"✅ Showing {len(pp_data)} real {selected_sport} props")
+        st.dataframe(preview_df, use_container_width=True, height=300)
     
     # Analysis
     if analyze_clicked:
         with st.spinner("🔄 Analyzing data..."):
             progress_bar = st.progress(0, text="Calculating EV...")
             
-            # Calculate EV
-            ev_data = calculate_ev(pp_data, market_data)
+            # EV comes precomputed (and cached) from get_ev
             progress_bar.progress(50, text="Finding optimal combinations...")
             
             if ev_data.empty:
                 st.error("❌ No matching props found")
                 st.stop()
             
-            # Apply filters
-            if selected_stats:
-                ev_data = ev_data[ev_data['stat_type'].isin(selected_stats)]
+            # Apply filters (to a local frame; the other tabs still read the full ev_data)
+            filtered_ev = ev_data[ev_data['stat_type'].isin(selected_stats)] if selected_stats else ev_data
             
-            positive_ev = ev_data[ev_data['is_positive']].copy()
-            positive_ev = positive_ev[positive_ev['ev'] >= min_ev]
-            display_positive_ev = positive_ev.copy()
+            # One fused mask; boolean indexing already returns a new frame, so no copy is needed
+            display_positive_ev = filtered_ev.loc[filtered_ev['is_positive'] & (filtered_ev['ev'] >= min_ev)]
             
             # Check bump risk
-            if exclude_bump_risk and not display_positive_ev.empty and bump_detector:
-                bump_warnings = bump_detector.get_bump_warning(display_positive_ev)
-                high_risk_players = [w['player'] for w in bump_warnings if w['risk'] == 'HIGH']
+            if exclude_bump_risk and 'bump_risk' in display_positive_ev:
+                high_risk_players = display_positive_ev.loc[display_positive_ev['bump_risk'] == 'HIGH', 'player'].unique()
                 display_positive_ev = display_positive_ev[~display_positive_ev['player'].isin(high_risk_players)]
             
             progress_bar.progress(75, text="Building parlay...")
             
             # Select picks
             if not display_positive_ev.empty:
-                unique_picks = display_positive_ev.sort_values('ev', ascending=False).drop_duplicates(subset=['player'], keep='first')
-                selected_picks = unique_picks.head(num_legs).copy()
+                # Best prop per player without sorting the whole frame
+                best_idx = display_positive_ev.groupby('player', sort=False, observed=True)['ev'].idxmax()
+                selected_picks = display_positive_ev.loc[best_idx].nlargest(num_legs, 'ev')
             else:
                 selected_picks = pd.DataFrame()
             
@@ -420,8 +556,7 @@ with tab1:
             penalty = 1.0
             warning = None
             if not selected_picks.empty and len(selected_picks) >= 2:
-                penalty = calculate_correlation_penalty(selected_picks)
-                warning = get_correlation_warning(selected_picks)
+                penalty, warning = cached_correlation(selected_picks)
             
             # Calculate probabilities
             raw_prob = calculate_parlay_probability(selected_picks) if not selected_picks.empty else 0
@@ -448,32 +583,42 @@ with tab1:
             st.subheader(f"🎯 Optimal {num_legs}-Leg Parlay")
             
             if not selected_picks.empty and bankroll_mgr:
-                parlay_data = []
-                for _, pick in selected_picks.iterrows():
-                    # Calculate stake using Kelly
-                    stake_info = bankroll_mgr.calculate_stake(2.0, pick['ev'])
-                    
-                    parlay_data.append({
-                        'Player': pick['player'],
-                        'Stat': pick['stat_type'],
-                        'Line': pick['line'],
-                        'Pick': pick['direction'],
-                        'EV': f"{pick['ev']:.1%}",
-                        'Stake': f"${stake_info['amount']:.2f}"
-                    })
+                # Pull the pick columns out once; the table, share text and buttons all reuse them
+                players = selected_picks['player'].to_numpy(dtype=object)
+                stat_types = selected_picks['stat_type'].to_numpy(dtype=object)
+                lines = selected_picks['line'].to_numpy()
+                directions = selected_picks['direction'].to_numpy(dtype=object)
+                evs = selected_picks['ev'].to_numpy()
+                
+                # Calculate all stakes using Kelly in one vectorized call
+                stakes = bankroll_mgr.calculate_stakes(2.0, evs)
+                
+                parlay_data = pd.DataFrame({
+                    'Player': players,
+                    'Stat': stat_types,
+                    'Line': lines,
+                    'Pick': directions,
+                    'EV': [f"{ev:.1%}" for ev in evs],
+                    'Stake': [f"${amount:.2f}" for amount in stakes]
+                })
                 
-                st.dataframe(pd.DataFrame(parlay_data), use_container_width=True, height=400)
+                st.dataframe(parlay_data, use_container_width=True, height=400)
                 
                 # Share Feature
                 st.subheader("📤 Share This Parlay")
                 
                 # Create share text
-                share_text = "🎯 My +EV Parlay from PrizePicks Pro:\n\n"
-                for _, pick in selected_picks.iterrows():
-                    share_text += f"• {pick['player']} {pick['stat_type']} {pick['direction']} {pick['line']} (EV: {pick['ev']:.1%})\n"
-                share_text += f"\n📊 Average EV: {selected_picks['ev'].mean():.1%}"
-                share_text += f"\n🎯 Win Probability: {adjusted_prob:.1%}"
-                share_text += f"\n\nBuilt with PrizePicks +EV Pro"
+                share_lines = [
+                    f"• {player} {stat_type} {direction} {line} (EV: {ev:.1%})"
+                    for player, stat_type, direction, line, ev in zip(players, stat_types, directions, lines.tolist(), evs)
+                ]
+                share_text = (
+                    "🎯 My +EV Parlay from PrizePicks Pro:\n\n"
+                    + "\n".join(share_lines)
+                    + f"\n\n📊 Average EV: {evs.mean():.1%}"
+                    + f"\n🎯 Win Probability: {adjusted_prob:.1%}"
+                    + "\n\nBuilt with PrizePicks +EV Pro"
+                )
                 
                 col1, col2 = st.columns(2)
                 with col1:
@@ -498,29 +643,27 @@ with tab1:
                 col1, col2 = st.columns(2)
                 with col1:
                     if st.button("📝 Log This Parlay") and bet_tracker:
-                        for _, pick in selected_picks.iterrows():
-                            bet_tracker.add_bet(
-                                sport=selected_sport,
-                                player=pick['player'],
-                                stat_type=pick['stat_type'],
-                                line=pick['line'],
-                                pick=pick['direction'],
-                                odds=2.0,
-                                stake=bankroll_mgr.calculate_stake(2.0, pick['ev'])['amount'],
-                                notes="Auto-logged from parlay"
-                            )
+                        # Reuse the stakes computed for the parlay table; one transaction for all legs
+                        bet_tracker.add_bets_bulk([{
+                            'sport': selected_sport,
+                            'player': player,
+                            'stat_type': stat_type,
+                            'line': line,
+                            'pick': direction,
+                            'odds': 2.0,
+                            'stake': stake,
+                            'notes': "Auto-logged from parlay"
+                        } for player, stat_type, line, direction, stake in zip(
+                            players, stat_types, lines.tolist(), directions, stakes.tolist()
+                        )])
                         st.success("✅ Parlay logged!")
                 
                 with col2:
                     if st.button("🔔 Set Alert") and alert_mgr:
-                        for _, pick in selected_picks.iterrows():
-                            alert_mgr.add_alert(
-                                sport=selected_sport,
-                                player=pick['player'],
-                                stat_type=pick['stat_type'],
-                                threshold=pick['ev'],
-                                condition='>='
-                            )
+                        alert_mgr.add_custom_alerts_bulk([
+                            {'player': player, 'stat_type': stat_type, 'threshold': ev, 'condition': '>='}
+                            for player, stat_type, ev in zip(players, stat_types, evs.tolist())
+                        ])
                         st.success("✅ Alerts set!")
             
             if warning:
@@ -529,12 +672,9 @@ with tab1:
             # EV Chart
             st.subheader("📊 EV Distribution")
             if not display_positive_ev.empty:
-                chart_data = display_positive_ev.head(15).copy()
-                chart_data['player_short'] = chart_data['player'].apply(lambda x: x.split()[-1])
-                
-                fig = px.bar(chart_data, x='player_short', y='ev', color='ev',
-                            color_continuous_scale='RdYlGn', title="Top 15 Props by EV")
-                fig.update_layout(xaxis_tickangle=-45, height=400, yaxis_tickformat='.0%')
+                # Only the plotted columns feed the cache key
+                chart_data = display_positive_ev[['player_short', 'ev']].head(15)
+                fig = go.Figure(build_ev_bar_fig(chart_data))
                 st.plotly_chart(fig, use_container_width=True)
             
             # Generate widget data
@@ -544,7 +684,9 @@ with tab1:
 # ============================================
 # TAB 2: BET TRACKER (FULL FEATURES)
 # ============================================
-with tab2:
+# Tabs 2, 3 and 6 run as fragments: their widgets rerun only that tab, not the whole app
+@st.fragment
+def render_bet_tracker_tab():
     st.subheader("📊 Bet Tracking & Performance")
     
     if not bet_tracker:
@@ -553,81 +695,72 @@ with tab2:
         # Date range selector
         col1, col2 = st.columns(2)
         with col1:
-            days_filter = st.selectbox("Time Period", [7, 30, 90, 365], index=1, format_func=lambda x: f"Last {x} days")
+            days_filter = st.selectbox("Time Period", list(PERIOD_LABELS), index=1, format_func=PERIOD_LABELS.get)
         with col2:
             sport_filter = st.selectbox("Sport", ["All", "NBA", "NFL", "MLB", "NHL", "SOCCER", "TENNIS"])
         
         # Get stats
-        stats = bet_tracker.get_statistics(days=days_filter)
-        bets_df = bet_tracker.get_bets(sport=sport_filter if sport_filter != "All" else None, days=days_filter)
+        bets_sport = sport_filter if sport_filter != "All" else None
+        stats = cached_bet_statistics(days_filter, _bets_version())
+        bets_df = cached_bets(bets_sport, days_filter, _bets_version())
+        # Slice completed bets once; analytics and the history table both read it
+        # (an empty history still has its columns, so no empty-frame fallback is needed)
+        completed = bets_df[bets_df['outcome'].notna()]
         
-        # Display metrics
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Total Bets", stats['total_bets'])
-        with col2:
-            st.metric("Win Rate", f"{stats['win_rate']:.1f}%")
-        with col3:
-            st.metric("Total Profit", f"${stats['total_profit']:.2f}")
-        with col4:
-            st.metric("ROI", f"{stats['roi']:.1f}%")
+        # Display metrics as one table element instead of four column/metric widgets
+        st.dataframe(
+            pd.DataFrame({
+                'Total Bets': [stats['total_bets']],
+                'Win Rate': [stats['win_rate']],
+                'Total Profit': [stats['total_profit']],
+                'ROI': [stats['roi']]
+            }),
+            column_config={
+                'Win Rate': st.column_config.NumberColumn(format="%.1f%%"),
+                'Total Profit': st.column_config.NumberColumn(format="$%.2f"),
+                'ROI': st.column_config.NumberColumn(format="%.1f%%")
+            },
+            hide_index=True,
+            use_container_width=True
+        )
         
         # Enhanced Analytics
         st.subheader("📈 Advanced Analytics")
         
-        if not bets_df.empty and len(bets_df) > 0:
-            # Filter to completed bets
-            completed_bets = bets_df[bets_df['outcome'].notna()].copy()
+        if not bets_df.empty:
+            # Precompute wins once so every groupby below can use the built-in 'sum'
+            completed_bets = completed.assign(
+                win=completed['outcome'].eq('Win').astype('int32'),
+                player=completed['player'].astype('category')
+            )
             
             if not completed_bets.empty:
                 # 1. Win Rate by Sport
                 st.markdown("### 🏆 Win Rate by Sport")
-                sport_stats = completed_bets.groupby('sport').agg({
-                    'outcome': lambda x: (x == 'Win').sum(),
-                    'stake': 'sum',
-                    'profit': 'sum',
-                    'id': 'count'
-                }).rename(columns={'outcome': 'wins', 'id': 'bets'})
-                
-                sport_stats['win_rate'] = (sport_stats['wins'] / sport_stats['bets'] * 100).round(1)
-                sport_stats['roi'] = (sport_stats['profit'] / sport_stats['stake'] * 100).round(1)
+                sport_chart_data = cached_sport_stats(bets_sport, days_filter, _bets_version())
+                sport_chart_data['win_rate'] = (sport_chart_data['wins'] / sport_chart_data['bets'] * 100).round(1)
+                sport_chart_data['roi'] = (sport_chart_data['profit'] / sport_chart_data['stake'] * 100).round(1)
                 
-                fig = px.bar(
-                    sport_stats.reset_index(), 
-                    x='sport', 
-                    y='win_rate', 
-                    color='win_rate',
-                    color_continuous_scale='RdYlGn',
-                    title='Win Rate by Sport',
-                    text=sport_stats['win_rate'].apply(lambda x: f'{x}%')
-                )
-                fig.update_traces(textposition='outside')
-                fig.update_layout(yaxis_range=[0, 100])
+                fig = go.Figure(build_sport_winrate_fig(sport_chart_data))
                 st.plotly_chart(fig, use_container_width=True)
                 
                 # 2. Profit/Loss by Sport
-                fig2 = px.bar(
-                    sport_stats.reset_index(),
-                    x='sport',
-                    y='profit',
-                    color='profit',
-                    color_continuous_scale='RdYlGn',
-                    title='Profit/Loss by Sport',
-                    text=sport_stats['profit'].apply(lambda x: f'${x:.0f}')
-                )
-                fig2.update_traces(textposition='outside')
+                fig2 = go.Figure(build_sport_profit_fig(sport_chart_data))
                 st.plotly_chart(fig2, use_container_width=True)
                 
                 # 3. Best Performing Players
                 st.markdown("### ⭐ Top Performing Players")
-                player_stats = completed_bets.groupby('player').agg({
-                    'profit': 'sum',
-                    'outcome': lambda x: (x == 'Win').sum(),
-                    'id': 'count'
-                }).rename(columns={'outcome': 'wins', 'id': 'bets'})
+                # Drop the long tail of players with fewer than 3 bets before aggregating
+                player_counts = completed_bets['player'].value_counts()
+                frequent_bets = completed_bets[completed_bets['player'].isin(player_counts.index[player_counts >= 3])]
+                player_stats = frequent_bets.groupby('player', sort=False, observed=True).agg(
+                    profit=('profit', 'sum'),
+                    wins=('win', 'sum'),
+                    bets=('win', 'size')
+                )
                 
                 player_stats['win_rate'] = (player_stats['wins'] / player_stats['bets'] * 100).round(1)
-                player_stats = player_stats[player_stats['bets'] >= 3].sort_values('profit', ascending=False).head(10)
+                player_stats = player_stats.sort_values('profit', ascending=False).head(10)
                 
                 if not player_stats.empty:
                     st.dataframe(
@@ -643,38 +776,29 @@ with tab2:
                 # 4. Performance Over Time
                 st.markdown("### 📅 Performance Trend")
                 
-                # Group by week
-                completed_bets['week'] = pd.to_datetime(completed_bets['date']).dt.strftime('%Y-%U')
-                weekly_stats = completed_bets.groupby('week').agg({
-                    'profit': 'sum',
-                    'id': 'count'
-                }).rename(columns={'id': 'bets'})
-                
-                fig3 = px.line(
-                    weekly_stats.reset_index(),
-                    x='week',
-                    y='profit',
-                    title='Weekly Profit/Loss',
-                    markers=True
+                # Group by week (date is already datetime64 from get_bets)
+                weekly_stats = completed_bets.groupby(pd.Grouper(key='date', freq='W')).agg(
+                    profit=('profit', 'sum'),
+                    bets=('win', 'size')
                 )
-                fig3.add_hline(y=0, line_dash="dash", line_color="red")
+                
+                fig3 = go.Figure(build_weekly_fig(weekly_stats.reset_index()))
                 st.plotly_chart(fig3, use_container_width=True)
                 
                 # 5. Bet Size Analysis
                 st.markdown("### 💰 Bet Size Analysis")
                 
-                # Create bet size buckets
-                completed_bets['size_bucket'] = pd.cut(
-                    completed_bets['stake'],
-                    bins=[0, 10, 25, 50, 100, 500],
-                    labels=['$0-10', '$10-25', '$25-50', '$50-100', '$100+']
-                )
+                # Bucket stakes by integer code; labels are only applied for display
+                size_labels = ['$0-10', '$10-25', '$25-50', '$50-100', '$100+']
+                size_codes = np.digitize(completed_bets['stake'].to_numpy(), [10, 25, 50, 100], right=True)
                 
-                size_stats = completed_bets.groupby('size_bucket').agg({
-                    'profit': 'sum',
-                    'outcome': lambda x: (x == 'Win').sum(),
-                    'id': 'count'
-                }).rename(columns={'outcome': 'wins', 'id': 'bets'})
+                size_stats = completed_bets.groupby(size_codes).agg(
+                    profit=('profit', 'sum'),
+                    wins=('win', 'sum'),
+                    bets=('win', 'size')
+                )
+                size_stats = size_stats.reindex(range(len(size_labels)), fill_value=0)
+                size_stats.index = pd.Index(size_labels, name='size_bucket')
                 
                 size_stats['win_rate'] = (size_stats['wins'] / size_stats['bets'] * 100).round(1)
                 
@@ -686,7 +810,7 @@ with tab2:
         col1, col2, col3 = st.columns(3)
         with col1:
             if st.button("📊 Export to CSV") and not bets_df.empty:
-                csv = bets_df.to_csv(index=False)
+                csv = cached_bets_csv(bets_sport, days_filter, _bets_version())
                 st.download_button(
                     label="📥 Download CSV",
                     data=csv,
@@ -717,39 +841,53 @@ with tab2:
         
         with col3:
             if st.button("📋 Copy to Clipboard") and not bets_df.empty:
-                st.code(bets_df.to_string(), language="text")
+                st.code(cached_bets_csv(bets_sport, days_filter, _bets_version()), language="csv")
                 st.success("✅ Select all and copy (Cmd+C / Ctrl+C)")
         
         # Bet history
         st.subheader("📜 Bet History")
         
         # Add outcome input for pending bets
-        pending = bets_df[bets_df['outcome'].isna()] if not bets_df.empty else pd.DataFrame()
-        if not pending.empty:
+        def render_pending_bets(sport, days):
+            bets = cached_bets(sport, days, _bets_version())
+            pending = bets[bets['outcome'].isna()]
+            if pending.empty:
+                return
+            
             st.warning(f"⚠️ {len(pending)} bets pending result")
             
-            for _, bet in pending.iterrows():
-                col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-                with col1:
-                    st.write(f"{bet['player']} - {bet['stat_type']} {bet['line']} ({bet['pick']})")
-                with col2:
-                    st.write(f"${bet['stake']:.2f}")
-                with col3:
-                    if st.button(f"✅ Win", key=f"win_{bet['id']}"):
-                        profit = bet['stake'] * (bet['odds'] - 1)
-                        bet_tracker.update_outcome(bet['id'], 'Win', profit)
-                        if bankroll_mgr:
-                            bankroll_mgr.update_bankroll(bet['stake'], profit)
-                        st.rerun()
-                with col4:
-                    if st.button(f"❌ Loss", key=f"loss_{bet['id']}"):
-                        bet_tracker.update_outcome(bet['id'], 'Loss', -bet['stake'])
-                        if bankroll_mgr:
-                            bankroll_mgr.update_bankroll(bet['stake'], -bet['stake'])
-                        st.rerun()
+            # Results are marked in the table and saved together in one transaction
+            info_cols = ['player', 'stat_type', 'line', 'pick', 'odds', 'stake']
+            edited = st.data_editor(
+                pending[info_cols].assign(result=None),
+                column_config={
+                    'result': st.column_config.SelectboxColumn("Result", options=['Win', 'Loss'])
+                },
+                disabled=info_cols,
+                hide_index=True,
+                use_container_width=True,
+                # New key after every write so edits never carry over to a different set of rows
+                key=f"pending_results_{_bets_version()}"
+            )
+            
+            if st.button("💾 Save Results", key="save_results"):
+                resolved = edited['result'].notna().to_numpy()
+                if resolved.any():
+                    is_win = edited['result'].to_numpy()[resolved] == 'Win'
+                    stakes = pending['stake'].to_numpy()[resolved]
+                    profits = np.where(is_win, stakes * (pending['odds'].to_numpy()[resolved] - 1), -stakes)
+                    bet_tracker.update_outcomes_bulk(zip(
+                        pending['id'].to_numpy()[resolved].tolist(),
+                        np.where(is_win, 'Win', 'Loss').tolist(),
+                        profits.tolist()
+                    ))
+                    if bankroll_mgr:
+                        bankroll_mgr.update_bankroll(stakes.sum(), profits.sum())
+                    st.rerun(scope="fragment")
+        
+        render_pending_bets(bets_sport, days_filter)
         
         # Show completed bets
-        completed = bets_df[bets_df['outcome'].notna()] if not bets_df.empty else pd.DataFrame()
         if not completed.empty:
             st.dataframe(
                 completed[['date', 'sport', 'player', 'stat_type', 'line', 'pick', 'odds', 'stake', 'outcome', 'profit']],
@@ -798,12 +936,16 @@ with tab2:
                         bet_tracker.update_outcome(bet_id, 'Loss', -manual_stake)
                 
                 st.success("✅ Bet saved!")
-                st.rerun()
+                st.rerun(scope="fragment")
+
+with tab2:
+    render_bet_tracker_tab()
 
 # ============================================
 # TAB 3: BANKROLL MANAGER (FULL FEATURES)
 # ============================================
-with tab3:
+@st.fragment
+def render_bankroll_tab():
     st.subheader("💰 Bankroll Management")
     
     if not bankroll_mgr:
@@ -828,31 +970,43 @@ with tab3:
         # Kelly Calculator
         st.subheader("🧮 Kelly Criterion Calculator")
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            kelly_odds = st.number_input("Decimal Odds", value=2.0, step=0.1, min_value=1.01, key="kelly_odds")
-        with col2:
-            kelly_edge = st.number_input("Edge (EV %)", value=5.0, step=1.0, key="kelly_edge") / 100
-        with col3:
-            kelly_fraction = st.selectbox("Kelly Fraction", [0.25, 0.5, 0.75, 1.0], index=0, 
-                                          format_func=lambda x: f"{int(x*100)}% Kelly", key="kelly_fraction")
+        # Inputs only rerun the app when the form is submitted, not on every keystroke
+        with st.form("kelly_calculator", border=False):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                kelly_odds = st.number_input("Decimal Odds", value=2.0, step=0.1, min_value=1.01, key="kelly_odds")
+            with col2:
+                kelly_edge = st.number_input("Edge (EV %)", value=5.0, step=1.0, key="kelly_edge") / 100
+            with col3:
+                kelly_fraction = st.selectbox("Kelly Fraction", [0.25, 0.5, 0.75, 1.0], index=0, 
+                                              format_func=lambda x: f"{int(x*100)}% Kelly", key="kelly_fraction")
+            
+            submitted = st.form_submit_button("🧮 Calculate Stake", use_container_width=True)
         
-        stake_info = bankroll_mgr.calculate_stake(kelly_odds, kelly_edge, kelly_fraction)
+        # Only recompute on submit; the last result is kept for the reruns in between
+        if submitted:
+            st.session_state['kelly_result'] = (
+                bankroll_mgr.calculate_stake(kelly_odds, kelly_edge, kelly_fraction=kelly_fraction),
+                kelly_odds
+            )
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Recommended Stake", f"${stake_info['amount']:.2f}")
-        with col2:
-            st.metric("% of Bankroll", f"{stake_info['percentage']}%")
-        with col3:
-            st.metric("Potential Profit", f"${stake_info['amount'] * (kelly_odds - 1):.2f}")
+        if 'kelly_result' in st.session_state:
+            stake_info, stake_odds = st.session_state['kelly_result']
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Recommended Stake", f"${stake_info['amount']:.2f}")
+            with col2:
+                st.metric("% of Bankroll", f"{stake_info['percentage']}%")
+            with col3:
+                st.metric("Potential Profit", f"${stake_info['amount'] * (stake_odds - 1):.2f}")
         
         # Bankroll history
         st.subheader("📈 Bankroll History")
         bankroll_history = bet_tracker.get_bankroll_history(days=90) if bet_tracker else pd.DataFrame()
         
         if not bankroll_history.empty:
-            fig = px.line(bankroll_history, x='date', y='amount', title='Bankroll Over Time')
+            fig = _px().line(bankroll_history, x='date', y='amount', title='Bankroll Over Time')
             st.plotly_chart(fig, use_container_width=True)
         
         # Betting limits guide
@@ -870,6 +1024,9 @@ with tab3:
             - **Quarter Kelly (25%)** = Very conservative, recommended for beginners
             """)
 
+with tab3:
+    render_bankroll_tab()
+
 # ============================================
 # TAB 4: BUMP DETECTOR (FULL FEATURES)
 # ============================================
@@ -881,34 +1038,30 @@ with tab4:
         st.warning("Bump Detector module not available")
     else:
         with st.spinner("Analyzing bump risks..."):
-            pp_data, market_data = load_data(selected_sport)
-            ev_data = calculate_ev(pp_data, market_data)
-            
             if not ev_data.empty:
-                bump_warnings = bump_detector.get_bump_warning(ev_data, threshold=min_ev)
+                risk_counts = ev_data['bump_risk'].value_counts()
                 
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    high_risk = len([w for w in bump_warnings if w['risk'] == 'HIGH'])
-                    st.metric("High Risk Props", high_risk)
+                    st.metric("High Risk Props", int(risk_counts.get('HIGH', 0)))
                 with col2:
-                    medium_risk = len([w for w in bump_warnings if w['risk'] == 'MEDIUM'])
-                    st.metric("Medium Risk Props", medium_risk)
+                    st.metric("Medium Risk Props", int(risk_counts.get('MEDIUM', 0)))
                 with col3:
-                    low_risk = len([w for w in bump_warnings if w['risk'] == 'LOW'])
-                    st.metric("Low Risk Props", low_risk)
+                    st.metric("Low Risk Props", int(risk_counts.get('LOW', 0)))
                 
-                if bump_warnings:
-                    warnings_df = pd.DataFrame(bump_warnings)
+                if not bump_warnings.empty:
+                    warnings_df = bump_warnings
                     
-                    def color_risk(val):
-                        colors = {'HIGH': 'background-color: #ff4444', 
-                                 'MEDIUM': 'background-color: #ff8800',
-                                 'LOW': 'background-color: #ffbb33'}
-                        return colors.get(val, '')
+                    # Build the whole risk colour column in one pass instead of styling cell by cell
+                    risk = warnings_df['risk'].to_numpy()
+                    risk_colors = np.select(
+                        [risk == 'HIGH', risk == 'MEDIUM', risk == 'LOW'],
+                        ['background-color: #ff4444', 'background-color: #ff8800', 'background-color: #ffbb33'],
+                        default=''
+                    )
                     
                     st.dataframe(
-                        warnings_df.style.applymap(color_risk, subset=['risk']),
+                        warnings_df.style.apply(lambda _: risk_colors, subset=['risk']),
                         use_container_width=True,
                         height=400
                     )
@@ -942,27 +1095,23 @@ with tab5:
         st.warning("Arbitrage Scanner module not available")
     else:
         with st.spinner("Scanning for arbitrage opportunities..."):
-            pp_data, market_data = load_data(selected_sport)
-            ev_data = calculate_ev(pp_data, market_data)
-            
             if not ev_data.empty:
-                arb_opportunities = arb_scanner.calculate_arbitrage(ev_data.to_dict('records'))
+                arb_opportunities = arb_scanner.calculate_arbitrage(ev_data)
                 
                 col1, col2 = st.columns(2)
                 with col1:
                     st.metric("Arbitrage Opportunities", len(arb_opportunities))
                 with col2:
-                    if arb_opportunities:
-                        max_profit = max([o['profit_pct'] for o in arb_opportunities])
+                    if not arb_opportunities.empty:
+                        max_profit = arb_opportunities['profit_pct'].max()
                         st.metric("Max Profit", f"{max_profit}%")
                 
-                if arb_opportunities:
-                    arb_df = pd.DataFrame(arb_opportunities)
-                    st.dataframe(arb_df, use_container_width=True, height=400)
+                if not arb_opportunities.empty:
+                    st.dataframe(arb_opportunities, use_container_width=True, height=400)
                     
                     if len(arb_opportunities) > 0:
                         with st.expander("📊 Arbitrage Calculation Example"):
-                            arb = arb_opportunities[0]
+                            arb = arb_opportunities.iloc[0]
                             st.markdown(f"""
                             **Opportunity:** {arb['players']}
                             
@@ -992,7 +1141,10 @@ with tab5:
 # ============================================
 # TAB 6: ALERTS MANAGER (FULL FEATURES)
 # ============================================
-with tab6:
+ALERT_HISTORY_PAGE_SIZE = 100
+
+@st.fragment
+def render_alerts_tab():
     st.subheader("🔔 Smart Alerts")
     st.caption("Get notified when +EV opportunities appear")
     
@@ -1000,83 +1152,111 @@ with tab6:
         st.warning("Alert Manager module not available")
     else:
         with st.expander("⚙️ Alert Settings", expanded=True):
-            col1, col2 = st.columns(2)
-            with col1:
-                alert_sports = st.multiselect("Sports to monitor", 
-                    ["NBA", "NFL", "MLB", "NHL", "SOCCER", "TENNIS"],
-                    default=["NBA"], key="alert_sports")
-                
-                alert_threshold = st.slider("EV Threshold %", 1, 15, 5, 1, key="alert_threshold")
-                
-            with col2:
-                alert_frequency = st.selectbox("Alert Frequency", 
-                    ["Instant", "Hourly Digest", "Daily Digest"], index=0, key="alert_frequency")
+            # Settings are only applied on save, so the slider doesn't rerun the app mid-drag
+            with st.form("alert_settings_form", border=False):
+                col1, col2 = st.columns(2)
+                with col1:
+                    alert_sports = st.multiselect("Sports to monitor", 
+                        ["NBA", "NFL", "MLB", "NHL", "SOCCER", "TENNIS"],
+                        default=["NBA"], key="alert_sports")
+                    
+                    alert_threshold = st.slider("EV Threshold %", 1, 15, 5, 1, key="alert_threshold")
+                    
+                with col2:
+                    alert_frequency = st.selectbox("Alert Frequency", 
+                        ["Instant", "Hourly Digest", "Daily Digest"], index=0, key="alert_frequency")
+                    
+                    alert_methods = st.multiselect("Alert Methods",
+                        ["In-App", "Email", "Push Notification"],
+                        default=["In-App"], key="alert_methods")
                 
-                alert_methods = st.multiselect("Alert Methods",
-                    ["In-App", "Email", "Push Notification"],
-                    default=["In-App"], key="alert_methods")
-            
-            if st.button("💾 Save Alert Settings", key="save_alert_settings"):
-                alert_mgr.update_settings({
-                    'sports': alert_sports,
-                    'threshold': alert_threshold / 100,
-                    'frequency': alert_frequency,
-                    'methods': alert_methods
-                })
-                st.success("✅ Alert settings saved!")
+                if st.form_submit_button("💾 Save Alert Settings"):
+                    alert_mgr.update_settings({
+                        'sports': alert_sports,
+                        'threshold': alert_threshold / 100,
+                        'frequency': alert_frequency,
+                        'methods': alert_methods
+                    })
+                    st.success("✅ Alert settings saved!")
         
         st.subheader("➕ Create Custom Alert")
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            alert_player = st.text_input("Player Name (optional)", placeholder="Leave empty for all", key="alert_player")
-        with col2:
-            alert_stat = st.selectbox("Stat Type", ["All", "Points", "Rebounds", "Assists", "PRA", "3PM"], key="alert_stat")
-        with col3:
-            alert_condition = st.selectbox("Condition", ["Any", "OVER", "UNDER"], key="alert_condition")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            alert_value = st.number_input("Threshold Value", value=alert_threshold, step=1, key="alert_value")
-        with col2:
-            alert_expiry = st.date_input("Alert Expiry", value=datetime.now() + timedelta(days=7), key="alert_expiry")
-        
-        if st.button("➕ Add Custom Alert", key="add_custom_alert"):
-            alert_mgr.add_custom_alert(
-                player=alert_player if alert_player else None,
-                stat_type=alert_stat if alert_stat != "All" else None,
-                condition=alert_condition if alert_condition != "Any" else None,
-                threshold=alert_value / 100,
-                expiry=alert_expiry
-            )
-            st.success("✅ Custom alert created!")
+        with st.form("custom_alert_form", border=False):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                alert_player = st.text_input("Player Name (optional)", placeholder="Leave empty for all", key="alert_player")
+            with col2:
+                alert_stat = st.selectbox("Stat Type", ["All", "Points", "Rebounds", "Assists", "PRA", "3PM"], key="alert_stat")
+            with col3:
+                alert_condition = st.selectbox("Condition", ["Any", "OVER", "UNDER"], key="alert_condition")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                alert_value = st.number_input("Threshold Value", value=alert_threshold, step=1, key="alert_value")
+            with col2:
+                alert_expiry = st.date_input("Alert Expiry", value=datetime.now() + timedelta(days=7), key="alert_expiry")
+            
+            if st.form_submit_button("➕ Add Custom Alert"):
+                alert_mgr.add_custom_alert(
+                    player=alert_player if alert_player else None,
+                    stat_type=alert_stat if alert_stat != "All" else None,
+                    condition=alert_condition if alert_condition != "Any" else None,
+                    threshold=alert_value / 100,
+                    expiry=alert_expiry
+                )
+                st.success("✅ Custom alert created!")
         
         st.subheader("🟢 Active Alerts")
         active_alerts = alert_mgr.get_active_alerts()
         
         if active_alerts:
             alerts_df = pd.DataFrame(active_alerts)
-            st.dataframe(alerts_df, use_container_width=True, height=300)
+            display_large_dataframe(alerts_df, key_prefix="alerts", use_container_width=True, height=300)
             
             if st.button("❌ Clear All Alerts", key="clear_alerts"):
                 alert_mgr.clear_all_alerts()
-                st.rerun()
+                st.rerun(scope="fragment")
         else:
             st.info("No active alerts")
         
         with st.expander("📜 Alert History"):
-            alert_history = bet_tracker.get_alerts(days=7) if bet_tracker else pd.DataFrame()
+            version = _alerts_version()
+            total_alerts = cached_alert_count(7, version)
+            
+            # Keyset cursors of the pages above the current one; None is the newest page
+            cursors = st.session_state.setdefault('alert_history_cursors', [None])
+            alert_history = cached_alert_history(7, ALERT_HISTORY_PAGE_SIZE, cursors[-1], version)
             
             if not alert_history.empty:
-                st.dataframe(alert_history[['date', 'sport', 'player', 'stat_type', 'ev', 'message']],
-                            use_container_width=True, height=300)
+                first = (len(cursors) - 1) * ALERT_HISTORY_PAGE_SIZE + 1
+                st.caption(f"🔔 {total_alerts} alerts in the last 7 days - showing {first}-{first + len(alert_history) - 1}")
+                st.dataframe(alert_history[['sent_at', 'sport', 'player', 'stat_type', 'value', 'message']],
+                             use_container_width=True, height=300)
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    if len(cursors) > 1 and st.button("⬅️ Newer", key="alert_history_newer"):
+                        cursors.pop()
+                        st.rerun(scope="fragment")
+                with col2:
+                    if len(alert_history) == ALERT_HISTORY_PAGE_SIZE and st.button("Older ➡️", key="alert_history_older"):
+                        last = alert_history.iloc[-1]
+                        cursors.append((last['sent_at'], int(last['id'])))
+                        st.rerun(scope="fragment")
             else:
+                # A stale cursor (e.g. the page aged out of the window) falls back to the newest page
+                if len(cursors) > 1:
+                    cursors[:] = [None]
+                    st.rerun(scope="fragment")
                 st.info("No alerts triggered in the last 7 days")
         
         if st.button("🔔 Test Alert", key="test_alert"):
             alert_mgr.send_test_alert()
             st.success("✅ Test alert sent!")
 
+with tab6:
+    render_alerts_tab()
+
 # ============================================
 # TAB 7: IOS WIDGET (FULL FEATURES)
 # ============================================
@@ -1091,16 +1271,8 @@ with tab7:
         if 'display_positive_ev' in locals() and not display_positive_ev.empty:
             ios_widget.generate_widget_data(display_positive_ev, pp_data)
         else:
-            # Create sample data for preview
-            sample_ev = pd.DataFrame({
-                'player': ['LeBron James', 'Stephen Curry', 'Giannis Antetokounmpo', 'Luka Doncic', 'Joel Embiid'],
-                'stat_type': ['Points', '3PM', 'Rebounds', 'PRA', 'Points'],
-                'line': [25.5, 3.5, 12.5, 44.5, 31.5],
-                'ev': [0.08, 0.07, 0.06, 0.055, 0.05],
-                'is_positive': [True, True, True, True, True]
-            })
-            sample_pp = pd.DataFrame({'player': ['LeBron', 'Curry', 'Giannis', 'Luka', 'Embiid']})
-            ios_widget.generate_widget_data(sample_ev, sample_pp)
+            # Use sample data for preview
+            ios_widget.generate_widget_data(*sample_widget_data())
         
         st.markdown("### Widget Preview")
         ios_widget.render_widget_preview()
@@ -1141,17 +1313,23 @@ with tab7:
             The widget updates automatically based on your refresh settings.
             """)
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("📱 Share to Messages", key="share_messages"):
-                st.info("Sharing via Messages...")
-        with col2:
-            if st.button("📧 Share via Email", key="share_email"):
-                st.info("Opening email...")
-        with col3:
-            if st.button("🔗 Copy Link", key="copy_link"):
-                st.code("https://prizepicks-ipad-app.streamlit.app")
-                st.success("✅ Link copied!")
+        # Sharing is handled by the browser, so these buttons don't trigger a rerun
+        components.html(f"""
+        <style>
+            .share-row {{ display: flex; gap: 12px; font-family: sans-serif; }}
+            .share-row a, .share-row button {{
+                flex: 1; min-height: 55px; font-size: 18px; font-weight: 600;
+                border-radius: 15px; border: 1px solid #d0d3da; background: #ffffff;
+                color: #31333f; text-align: center; text-decoration: none;
+                display: flex; align-items: center; justify-content: center; cursor: pointer;
+            }}
+        </style>
+        <div class="share-row">
+            <button onclick="if (navigator.share) {{ navigator.share({{title: 'PrizePicks +EV Pro', url: '{APP_URL}'}}); }} else {{ window.open('sms:&body={APP_URL}', '_top'); }}">📱 Share to Messages</button>
+            <a href="mailto:?subject=PrizePicks%20%2BEV%20Pro&body={APP_URL}" target="_top">📧 Share via Email</a>
+            <button onclick="navigator.clipboard.writeText('{APP_URL}').then(() => {{ this.textContent = '✅ Link copied!'; }})">🔗 Copy Link</button>
+        </div>
+        """, height=70)
 
 # ============================================
 # TAB 8: AI PICKS (FULL FEATURES)
@@ -1165,9 +1343,7 @@ with tab8:
     else:
         if premium.check_feature_access(st.session_state.get('user_id', 'guest'), 'AI predictions'):
             with st.spinner("Generating AI predictions..."):
-                # Get current props
-                pp_data, _ = load_data(selected_sport)
-                
+                # Current props were loaded before the tabs
                 if not pp_data.empty:
                     # Generate AI picks
                     ai_picks = ml_predictor.generate_ai_picks(pp_data)
@@ -1210,19 +1386,19 @@ with tab9:
         st.warning("Calendar View module not available")
     else:
         # Get bets data
-        bets_df = bet_tracker.get_bets(days=365)
+        bets_df = cached_bets(None, 365, _bets_version())
         
         if not bets_df.empty:
             # Year selector
-            years = pd.to_datetime(bets_df['date']).dt.year.unique()
+            years = bets_df['date'].dt.year.unique()
             selected_year = st.selectbox("Year", sorted(years, reverse=True))
             
             # Render heatmap
-            calendar_view.render_heatmap(bets_df, selected_year)
+            calendar_view.render_heatmap(bets_df, selected_year, cached_daily_pnl(None, 365, _bets_version()))
             
             # Month selector
             selected_month = st.selectbox("Month", range(1, 13), 
-                                          format_func=lambda x: datetime(2000, x, 1).strftime('%B'))
+                                          format_func=lambda x: MONTH_NAMES[x - 1])
             
             # Render month calendar
             calendar_view.render_month_calendar(selected_year, selected_month)
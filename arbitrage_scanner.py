@@ -2,73 +2,97 @@
 Arbitrage Scanner - Find risk-free betting opportunities
 """
 
-import itertools
-from decimal import Decimal, getcontext
-
-getcontext().prec = 6
+import numpy as np
+import pandas as pd
 
 class ArbitrageScanner:
     def __init__(self):
         self.min_profit_pct = 0.01  # Minimum 1% profit to show
+        self.block_size = 256  # Rows per pairwise block (bounds the temp matrix size)
     
-    def calculate_arbitrage(self, props, odds_key='implied_prob'):
+    def calculate_arbitrage(self, props_df, odds_key='implied_prob'):
         """
-        Check for arbitrage opportunities between props
+        Check for arbitrage opportunities between props (returns a DataFrame)
         """
-        opportunities = []
+        columns = ['type', 'players', 'stats', 'profit_pct', 'stake_1', 'stake_2',
+                   'total_stake', 'guaranteed_profit']
         
-        # Check all combinations of 2 props
-        for prop1, prop2 in itertools.combinations(props, 2):
-            # Skip same player
-            if prop1['player'] == prop2['player']:
-                continue
-            
-            # Calculate combined probability
-            total_prob = prop1[odds_key] + prop2[odds_key]
-            
-            if total_prob < 1.0:
-                profit_pct = (1 / total_prob - 1) * 100
-                
-                if profit_pct >= self.min_profit_pct:
-                    # Calculate stakes
-                    stake1 = (1 / total_prob) * prop1[odds_key]
-                    stake2 = (1 / total_prob) * prop2[odds_key]
-                    
-                    opportunities.append({
-                        'type': 'Two-way arb',
-                        'players': f"{prop1['player']} vs {prop2['player']}",
-                        'stats': f"{prop1['stat_type']} & {prop2['stat_type']}",
-                        'profit_pct': round(profit_pct, 2),
-                        'stakes': {
-                            prop1['player']: round(stake1 * 100, 2),
-                            prop2['player']: round(stake2 * 100, 2)
-                        },
-                        'total_stake': round((stake1 + stake2) * 100, 2),
-                        'guaranteed_profit': round((1 / total_prob - 1) * 100, 2)
-                    })
+        if len(props_df) < 2:
+            return pd.DataFrame(columns=columns)
+        
+        probs = props_df[odds_key].to_numpy(dtype=float)
+        codes = pd.factorize(props_df['player'])[0]
+        players = props_df['player'].astype(str).to_numpy(dtype=object)
+        stats = props_df['stat_type'].astype(str).to_numpy(dtype=object)
+        n = len(probs)
+        positions = np.arange(n)
+        
+        # Check all combinations of 2 props, a block of rows at a time
+        pair_a, pair_b = [], []
+        for start in range(0, n, self.block_size):
+            rows = positions[start:start + self.block_size]
+            total = probs[rows, None] + probs[None, :]
+            mask = (positions[None, :] > rows[:, None]) & (codes[rows, None] != codes[None, :]) & (total < 1.0)
+            i, j = np.nonzero(mask)
+            pair_a.append(rows[i])
+            pair_b.append(j)
+        a, b = np.concatenate(pair_a), np.concatenate(pair_b)
         
-        # Check for 3-way arb (more complex, but possible)
-        for prop1, prop2, prop3 in itertools.combinations(props, 3):
-            # Skip same player
-            if len({prop1['player'], prop2['player'], prop3['player']}) < 3:
+        total_prob = probs[a] + probs[b]
+        profit_pct = (1 / total_prob - 1) * 100
+        keep = profit_pct >= self.min_profit_pct
+        a, b, total_prob, profit_pct = a[keep], b[keep], total_prob[keep], profit_pct[keep]
+        
+        # Calculate stakes
+        stake1 = (1 / total_prob) * probs[a]
+        stake2 = (1 / total_prob) * probs[b]
+        two_way = pd.DataFrame({
+            'type': 'Two-way arb',
+            'players': players[a] + ' vs ' + players[b],
+            'stats': stats[a] + ' & ' + stats[b],
+            'profit_pct': np.round(profit_pct, 2),
+            'stake_1': np.round(stake1 * 100, 2),
+            'stake_2': np.round(stake2 * 100, 2),
+            'total_stake': np.round((stake1 + stake2) * 100, 2),
+            'guaranteed_profit': np.round(profit_pct, 2)
+        }, columns=columns)
+        
+        # Check for 3-way arb; only props that can still fit under 1.0 with the
+        # two cheapest others are expanded into a (j, k) grid
+        min_prob = probs.min()
+        triple_a, triple_b, triple_c = [], [], []
+        for i in range(n - 2):
+            if probs[i] + 2 * min_prob >= 1.0:
                 continue
-            
-            total_prob = prop1[odds_key] + prop2[odds_key] + prop3[odds_key]
-            
-            if total_prob < 1.0:
-                profit_pct = (1 / total_prob - 1) * 100
-                
-                if profit_pct >= self.min_profit_pct:
-                    opportunities.append({
-                        'type': 'Three-way arb',
-                        'players': f"{prop1['player']}, {prop2['player']}, {prop3['player']}",
-                        'stats': f"{prop1['stat_type']}, {prop2['stat_type']}, {prop3['stat_type']}",
-                        'profit_pct': round(profit_pct, 2),
-                        'total_stake': 100,  # Placeholder - would need exact calculation
-                        'guaranteed_profit': round(profit_pct, 2)
-                    })
+            js = positions[i + 1:][(probs[i + 1:] + probs[i] + min_prob < 1.0) & (codes[i + 1:] != codes[i])]
+            if len(js) == 0:
+                continue
+            total = probs[i] + probs[js, None] + probs[None, :]
+            mask = (positions[None, :] > js[:, None]) & (codes[None, :] != codes[i]) & (codes[None, :] != codes[js, None]) & (total < 1.0)
+            j, k = np.nonzero(mask)
+            triple_a.append(np.full(len(j), i))
+            triple_b.append(js[j])
+            triple_c.append(k)
+        
+        if triple_a:
+            a, b, c = np.concatenate(triple_a), np.concatenate(triple_b), np.concatenate(triple_c)
+        else:
+            a = b = c = np.array([], dtype=int)
+        
+        profit_pct = (1 / (probs[a] + probs[b] + probs[c]) - 1) * 100
+        keep = profit_pct >= self.min_profit_pct
+        a, b, c, profit_pct = a[keep], b[keep], c[keep], profit_pct[keep]
+        
+        three_way = pd.DataFrame({
+            'type': 'Three-way arb',
+            'players': players[a] + ', ' + players[b] + ', ' + players[c],
+            'stats': stats[a] + ', ' + stats[b] + ', ' + stats[c],
+            'profit_pct': np.round(profit_pct, 2),
+            'total_stake': 100,  # Placeholder - would need exact calculation
+            'guaranteed_profit': np.round(profit_pct, 2)
+        }, columns=columns)
         
-        return opportunities
+        return pd.concat([two_way, three_way], ignore_index=True)
     
     def find_correlation_arb(self, ev_data):
         """
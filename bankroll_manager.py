@@ -3,6 +3,7 @@ Bankroll Manager - Kelly Criterion and stake calculations
 """
 
 import math
+import numpy as np
 
 class BankrollManager:
     def __init__(self, initial_bankroll=1000):
@@ -29,15 +30,16 @@ class BankrollManager:
         
         return stake_pct
     
-    def calculate_stake(self, odds, edge, unit_size=0.01):
+    def calculate_stake(self, odds, edge, unit_size=0.01, kelly_fraction=0.25):
         """
         Calculate stake amount based on multiple methods
+        kelly_fraction: fraction of Kelly to use (0.25 = quarter Kelly)
         Returns: stake amount, method used
         """
         methods = []
         
         # Method 1: Kelly Criterion
-        kelly_pct = self.kelly_criterion(odds, edge)
+        kelly_pct = self.kelly_criterion(odds, edge, full_kelly=kelly_fraction)
         if kelly_pct > 0:
             methods.append(("Kelly", kelly_pct))
         
@@ -58,6 +60,28 @@ class BankrollManager:
             "methods": {name: round(pct * 100, 2) for name, pct in methods}
         }
     
+    def calculate_stakes(self, odds, edges, unit_size=0.01, kelly_fraction=0.25):
+        """
+        Vectorized calculate_stake for many picks at once
+        odds, edges: scalars or arrays (broadcast together)
+        Returns: array of recommended stake amounts
+        """
+        odds, edges = np.broadcast_arrays(np.asarray(odds, dtype=np.float64),
+                                          np.asarray(edges, dtype=np.float64))
+        
+        # Method 1: Kelly Criterion (fractional Kelly, only counted when positive)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            kelly_pct = ((0.5 + edges) * odds - 1) / (odds - 1) * kelly_fraction
+        kelly_pct = np.where((odds > 1) & (edges > 0), np.maximum(kelly_pct, 0), 0)
+        
+        # Methods 2 and 3: Fixed percentage and confidence-based
+        recommended_pct = np.minimum(unit_size, np.clip(edges * 2, 0.005, 0.05))
+        
+        # Use the most conservative method
+        recommended_pct = np.where(kelly_pct > 0, np.minimum(recommended_pct, kelly_pct), recommended_pct)
+        
+        return np.round(self.bankroll * recommended_pct, 2)
+    
     def update_bankroll(self, stake, profit):
         """Update bankroll after bet settlement"""
         self.bankroll += profit
@@ -2,91 +2,141 @@
 Bet Tracker - Log and analyze your betting performance
 """
 
-import sqlite3
 import pandas as pd
 import streamlit as st
+from database import get_conn
 from datetime import datetime, timedelta
-import plotly.express as px
-import plotly.graph_objects as go
+
+# Columns of the alerts table that get_alerts may project
+ALERT_COLUMNS = {'id', 'date', 'sport', 'player', 'stat_type', 'ev', 'message', 'sent_at'}
+
+# Bet columns returned as pandas categories by get_bets
+CATEGORY_COLUMNS = ('sport', 'stat_type', 'pick', 'outcome')
 
 class BetTracker:
-    def __init__(self):
-        self.conn = sqlite3.connect('betting_history.db', check_same_thread=False)
+    def __init__(self, conn=None):
+        self.conn = conn if conn is not None else get_conn()
         self.create_tables()
     
     def create_tables(self):
         """Create database tables if they don't exist"""
-        cursor = self.conn.cursor()
-        
-        # Bets table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS bets (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL,
-                sport TEXT NOT NULL,
-                player TEXT NOT NULL,
-                stat_type TEXT NOT NULL,
-                line REAL NOT NULL,
-                pick TEXT NOT NULL,
-                odds REAL NOT NULL,
-                stake REAL NOT NULL,
-                outcome TEXT,
-                profit REAL,
-                notes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Alerts table for notification history
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS alerts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL,
-                sport TEXT NOT NULL,
-                player TEXT NOT NULL,
-                stat_type TEXT NOT NULL,
-                ev REAL NOT NULL,
-                message TEXT NOT NULL,
-                sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Bankroll history table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS bankroll (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL,
-                amount REAL NOT NULL,
-                change REAL,
-                note TEXT,
-                recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        self.conn.commit()
+        with self.conn:
+            cursor = self.conn.cursor()
+            
+            # Bets table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS bets (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    date TEXT NOT NULL,
+                    sport TEXT NOT NULL,
+                    player TEXT NOT NULL,
+                    stat_type TEXT NOT NULL,
+                    line REAL NOT NULL,
+                    pick TEXT NOT NULL,
+                    odds REAL NOT NULL,
+                    stake REAL NOT NULL,
+                    outcome TEXT,
+                    profit REAL,
+                    notes TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Alerts table for notification history
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS alerts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    date TEXT NOT NULL,
+                    sport TEXT NOT NULL,
+                    player TEXT NOT NULL,
+                    stat_type TEXT NOT NULL,
+                    ev REAL NOT NULL,
+                    message TEXT NOT NULL,
+                    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Bankroll history table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS bankroll (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    date TEXT NOT NULL,
+                    amount REAL NOT NULL,
+                    change REAL,
+                    note TEXT,
+                    recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Index for the date/sport filters in get_bets
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_bets_date_sport
+                ON bets (date, sport)
+            ''')
     
     def add_bet(self, sport, player, stat_type, line, pick, odds, stake, notes=""):
         """Add a new bet to track"""
-        cursor = self.conn.cursor()
+        with self.conn:
+            cursor = self.conn.cursor()
+            date = datetime.now().strftime("%Y-%m-%d %H:%M")
+            
+            cursor.execute('''
+                INSERT INTO bets (date, sport, player, stat_type, line, pick, odds, stake, notes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (date, sport, player, stat_type, line, pick, odds, stake, notes))
+        return cursor.lastrowid
+    
+    def add_bets_bulk(self, bets):
+        """Add many bets in a single transaction"""
         date = datetime.now().strftime("%Y-%m-%d %H:%M")
+        rows = [(
+            date,
+            b['sport'],
+            b['player'],
+            b['stat_type'],
+            b['line'],
+            b['pick'],
+            b['odds'],
+            b['stake'],
+            b.get('notes', "")
+        ) for b in bets]
         
-        cursor.execute('''
-            INSERT INTO bets (date, sport, player, stat_type, line, pick, odds, stake, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (date, sport, player, stat_type, line, pick, odds, stake, notes))
+        if not rows:
+            return
         
-        self.conn.commit()
-        return cursor.lastrowid
+        with self.conn:
+            self.conn.executemany('''
+                INSERT INTO bets (date, sport, player, stat_type, line, pick, odds, stake, notes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
     
     def update_outcome(self, bet_id, outcome, profit):
         """Update bet with result"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            UPDATE bets 
-            SET outcome = ?, profit = ?
-            WHERE id = ?
-        ''', (outcome, profit, bet_id))
-        self.conn.commit()
+        with self.conn:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                UPDATE bets 
+                SET outcome = ?, profit = ?
+                WHERE id = ?
+            ''', (outcome, profit, bet_id))
+    
+    def update_outcomes_bulk(self, outcomes):
+        """Update many bet results in a single transaction
+        
+        Args:
+            outcomes: Iterable of (bet_id, outcome, profit)
+        """
+        rows = [(outcome, profit, bet_id) for bet_id, outcome, profit in outcomes]
+        
+        if not rows:
+            return
+        
+        with self.conn:
+            self.conn.executemany('''
+                UPDATE bets
+                SET outcome = ?, profit = ?
+                WHERE id = ?
+            ''', rows)
     
     def get_bets(self, sport=None, days=30):
         """Get betting history with filters"""
@@ -99,8 +149,53 @@ class BetTracker:
         
         query += " ORDER BY date DESC"
         
-        df = pd.read_sql_query(query, self.conn, params=params)
-        return df
+        with self.conn:
+            df = pd.read_sql_query(query, self.conn, params=params, parse_dates=['date'])
+        # Low-cardinality labels as categories so filters and groupbys work on int codes
+        return df.astype({col: 'category' for col in CATEGORY_COLUMNS})
+    
+    def get_sport_stats(self, sport=None, days=30):
+        """Aggregate completed bets per sport in SQL"""
+        query = '''
+            SELECT sport,
+                   SUM(outcome = 'Win') AS wins,
+                   SUM(stake) AS stake,
+                   SUM(profit) AS profit,
+                   COUNT(*) AS bets
+            FROM bets
+            WHERE date >= date('now', '-' || ? || ' days') AND outcome IS NOT NULL
+        '''
+        params = [days]
+        
+        if sport and sport != "All":
+            query += " AND sport = ?"
+            params.append(sport)
+        
+        query += " GROUP BY sport"
+        
+        with self.conn:
+            return pd.read_sql_query(query, self.conn, params=params)
+    
+    def get_daily_pnl(self, sport=None, days=365):
+        """Per-day bet count, wins and profit, aggregated in SQL"""
+        query = '''
+            SELECT date(date) AS day,
+                   TOTAL(profit) AS profit,
+                   COUNT(*) AS bets,
+                   SUM(outcome = 'Win') AS wins
+            FROM bets
+            WHERE date >= date('now', '-' || ? || ' days')
+        '''
+        params = [days]
+        
+        if sport and sport != "All":
+            query += " AND sport = ?"
+            params.append(sport)
+        
+        query += " GROUP BY day ORDER BY day"
+        
+        with self.conn:
+            return pd.read_sql_query(query, self.conn, params=params, parse_dates=['day'])
     
     def get_statistics(self, days=30):
         """Calculate betting performance metrics"""
@@ -136,40 +231,48 @@ class BetTracker:
     
     def add_bankroll_snapshot(self, amount, change=0, note=""):
         """Record bankroll history"""
-        cursor = self.conn.cursor()
-        date = datetime.now().strftime("%Y-%m-%d %H:%M")
-        
-        cursor.execute('''
-            INSERT INTO bankroll (date, amount, change, note)
-            VALUES (?, ?, ?, ?)
-        ''', (date, amount, change, note))
-        
-        self.conn.commit()
+        with self.conn:
+            cursor = self.conn.cursor()
+            date = datetime.now().strftime("%Y-%m-%d %H:%M")
+            
+            cursor.execute('''
+                INSERT INTO bankroll (date, amount, change, note)
+                VALUES (?, ?, ?, ?)
+            ''', (date, amount, change, note))
     
     def get_bankroll_history(self, days=90):
         """Get bankroll trend"""
         query = "SELECT * FROM bankroll WHERE date >= date('now', '-' || ? || ' days') ORDER BY date"
-        df = pd.read_sql_query(query, self.conn, params=[days])
+        with self.conn:
+            df = pd.read_sql_query(query, self.conn, params=[days])
         return df
     
     def add_alert(self, sport, player, stat_type, ev, message):
         """Log sent alerts"""
-        cursor = self.conn.cursor()
-        date = datetime.now().strftime("%Y-%m-%d %H:%M")
+        with self.conn:
+            cursor = self.conn.cursor()
+            date = datetime.now().strftime("%Y-%m-%d %H:%M")
+            
+            cursor.execute('''
+                INSERT INTO alerts (date, sport, player, stat_type, ev, message)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (date, sport, player, stat_type, ev, message))
+    
+    def get_alerts(self, days=7, columns=None):
+        """Get recent alerts
         
-        cursor.execute('''
-            INSERT INTO alerts (date, sport, player, stat_type, ev, message)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (date, sport, player, stat_type, ev, message))
+        Pass a tuple of column names to have SQLite return only those columns.
+        """
+        if columns:
+            unknown = set(columns) - ALERT_COLUMNS
+            if unknown:
+                raise ValueError(f"Unknown alert columns: {sorted(unknown)}")
         
-        self.conn.commit()
-    
-    def get_alerts(self, days=7):
-        """Get recent alerts"""
-        query = "SELECT * FROM alerts WHERE date >= date('now', '-' || ? || ' days') ORDER BY date DESC"
-        df = pd.read_sql_query(query, self.conn, params=[days])
-        return df
+        select = ", ".join(columns) if columns else "*"
+        query = f"SELECT {select} FROM alerts WHERE date >= date('now', '-' || ? || ' days') ORDER BY date DESC"
+        with self.conn:
+            return pd.read_sql_query(query, self.conn, params=[days])
     
     def close(self):
-        """Close database connection"""
-        self.conn.close()
\ No newline at end of file
+        """Release the tracker (the connection is shared or owned by the caller, so it stays open)"""
+        pass
\ No newline at end of file
@@ -2,6 +2,14 @@
 Bump Detector - Identify lines at risk of being bumped
 """
 
+import numpy as np
+import pandas as pd
+
+# Decimal-odds cut points shared by calculate_bump_risk, annotate and get_bump_warning
+RISK_BINS = [-np.inf, 1.71, 1.77, 1.85, np.inf]
+RISK_LABELS = ['HIGH', 'MEDIUM', 'LOW', 'MINIMAL']
+RISK_COLORS = {'HIGH': 'red', 'MEDIUM': 'orange', 'LOW': 'yellow', 'MINIMAL': 'green'}
+
 class BumpDetector:
     def __init__(self):
         # PrizePicks bump thresholds
@@ -26,23 +34,13 @@ class BumpDetector:
         
         decimal_odds = 1 / implied_prob
         
-        # Determine risk level
-        if decimal_odds <= 1.71:  # -140 or higher
-            risk = "HIGH"
-            color = "red"
-        elif decimal_odds <= 1.77:  # -130 to -139
-            risk = "MEDIUM"
-            color = "orange"
-        elif decimal_odds <= 1.85:  # -118 to -129
-            risk = "LOW"
-            color = "yellow"
-        else:
-            risk = "MINIMAL"
-            color = "green"
+        # Determine risk level: right-closed bins, same as pd.cut in annotate
+        # HIGH: -140 or higher, MEDIUM: -130 to -139, LOW: -118 to -129
+        risk = RISK_LABELS[np.searchsorted(RISK_BINS, decimal_odds) - 1]
         
         return {
             "risk": risk,
-            "color": color,
+            "color": RISK_COLORS[risk],
             "decimal_odds": round(decimal_odds, 2),
             "american_odds": self.decimal_to_american(decimal_odds)
         }
@@ -54,23 +52,47 @@ class BumpDetector:
         else:
             return f"{int(-100 / (decimal_odds - 1))}"
     
+    def annotate(self, ev_data):
+        """Add a categorical bump_risk column (NaN where the market is not likely enough to check)"""
+        if ev_data.empty or 'implied_prob' not in ev_data:
+            return ev_data
+        
+        implied = ev_data['implied_prob']
+        risk = pd.cut(1 / implied, bins=RISK_BINS, labels=RISK_LABELS)
+        return ev_data.assign(bump_risk=risk.where((implied > 0.55) & (implied < 1)))
+    
     def get_bump_warning(self, ev_data, threshold=0.05):
-        """Generate warnings for props at risk of bumping"""
-        warnings = []
+        """Generate warnings for props at risk of bumping (one row per prop)"""
+        columns = ['player', 'stat', 'risk', 'odds', 'ev', 'line', 'direction']
+        
+        # Only check if market thinks it's likely
+        implied = ev_data['implied_prob']
+        props = ev_data.loc[(implied > 0.55) & (implied < 1)]
+        if props.empty:
+            return pd.DataFrame(columns=columns)
+        
+        decimal_odds = 1 / props['implied_prob']
+        
+        # Same cut points as calculate_bump_risk
+        risk = pd.cut(decimal_odds, bins=RISK_BINS, labels=RISK_LABELS).astype(str)
+        
+        at_risk = risk.isin(['HIGH', 'MEDIUM'])
+        props = props.loc[at_risk]
+        decimal_odds = decimal_odds.loc[at_risk]
         
-        for _, prop in ev_data.iterrows():
-            if prop['implied_prob'] > 0.55:  # Only check if market thinks it's likely
-                risk = self.calculate_bump_risk(prop['implied_prob'])
-                
-                if risk['risk'] in ["HIGH", "MEDIUM"]:
-                    warnings.append({
-                        'player': prop['player'],
-                        'stat': prop['stat_type'],
-                        'risk': risk['risk'],
-                        'odds': risk['american_odds'],
-                        'ev': f"{prop['ev']:.1%}",
-                        'line': prop['line'],
-                        'direction': prop['direction']
-                    })
+        # American odds, truncated like decimal_to_american
+        american = np.where(
+            decimal_odds >= 2.0,
+            '+' + ((decimal_odds - 1) * 100).astype(int).astype(str),
+            (-100 / (decimal_odds - 1)).astype(int).astype(str)
+        )
         
-        return warnings
\ No newline at end of file
+        return pd.DataFrame({
+            'player': props['player'],
+            'stat': props['stat_type'],
+            'risk': risk.loc[at_risk],
+            'odds': american,
+            'ev': props['ev'].map('{:.1%}'.format),
+            'line': props['line'],
+            'direction': props['direction']
+        }, columns=columns).reset_index(drop=True)
@@ -4,7 +4,6 @@ Calendar View Module - Visualize betting activity on a calendar
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import calendar
@@ -76,14 +75,21 @@ class CalendarView:
         
         st.markdown(html, unsafe_allow_html=True)
     
-    def render_heatmap(self, bets_df, year):
-        """Render a year heatmap of betting activity"""
+    def render_heatmap(self, bets_df, year, daily_pnl=None):
+        """Render a year heatmap of betting activity
+        
+        daily_pnl: optional per-day totals (BetTracker.get_daily_pnl) used instead of grouping bets_df
+        """
         if bets_df.empty:
             st.info("No data available for heatmap")
             return
         
         # Prepare data
-        daily_stats = self.create_heatmap_data(bets_df, year=year)
+        if daily_pnl is not None:
+            in_year = daily_pnl[daily_pnl['day'].dt.year == year]
+            daily_stats = in_year.set_index(in_year['day'].dt.date)
+        else:
+            daily_stats = self.create_heatmap_data(bets_df, year=year)
         
         if daily_stats.empty:
             st.info(f"No betting data for {year}")
@@ -112,39 +112,24 @@ def calculate_correlation_matrix(players_list):
     Returns:
         DataFrame: Correlation matrix
     """
-    n = len(players_list)
+    # Get teams for each player
+    teams = np.array([get_team_from_player(player) for player in players_list], dtype=object)
+    known = teams != "OTHER"
+    
+    # Pairwise masks by broadcasting instead of a Python pair loop
+    same_team = (teams[:, None] == teams[None, :]) & known[:, None]
+    both_known = known[:, None] & known[None, :]
+    
+    # Same team -> negative, different known teams -> slight positive, unknown -> neutral
+    values = np.where(same_team, -0.25, np.where(both_known, 0.10, 0.0))
+    np.fill_diagonal(values, 1.0)
     
-    # Create empty matrix with 1s on diagonal
     corr_matrix = pd.DataFrame(
-        np.eye(n),
+        values,
         index=players_list,
         columns=players_list
     )
     
-    # Get teams for each player
-    teams = {player: get_team_from_player(player) for player in players_list}
-    
-    # Fill correlation values
-    for i in range(n):
-        for j in range(i+1, n):
-            player1 = players_list[i]
-            player2 = players_list[j]
-            
-            # Same team -> negative correlation
-            if teams[player1] == teams[player2] and teams[player1] != "OTHER":
-                # Stronger negative for same team
-                corr = -0.25
-            # Different teams -> slight positive
-            elif teams[player1] != "OTHER" and teams[player2] != "OTHER":
-                corr = 0.10
-            # Unknown team -> neutral
-            else:
-                corr = 0.0
-            
-            # Fill both sides of matrix
-            corr_matrix.iloc[i, j] = corr
-            corr_matrix.iloc[j, i] = corr
-    
     return corr_matrix
 
 def calculate_correlation_penalty(picks_df, weight=0.3):
@@ -164,14 +149,11 @@ def calculate_correlation_penalty(picks_df, weight=0.3):
     players = picks_df['player'].tolist()
     corr_matrix = calculate_correlation_matrix(players)
     
-    # Get all correlation pairs
-    correlations = []
-    for i in range(len(players)):
-        for j in range(i+1, len(players)):
-            corr = corr_matrix.iloc[i, j]
-            correlations.append(corr)
+    # Get all correlation pairs (upper triangle)
+    rows, cols = np.triu_indices(len(players), k=1)
+    correlations = corr_matrix.to_numpy()[rows, cols]
     
-    if not correlations:
+    if correlations.size == 0:
         return 1.0
     
     # Average correlation
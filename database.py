@@ -0,0 +1,49 @@
+"""
+Database - Shared SQLite connection for the betting history database
+"""
+
+import sqlite3
+import threading
+import streamlit as st
+
+DB_PATH = 'betting_history.db'
+
+class SharedConnection(sqlite3.Connection):
+    """Connection used by every session thread at once
+    
+    A `with conn:` block holds a process-wide lock until it commits or rolls
+    back, so one session can never commit or undo another session's
+    half-done writes. Managers run every query on it inside such a block.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.RLock()
+    
+    def __enter__(self):
+        self.lock.acquire()
+        return super().__enter__()
+    
+    def __exit__(self, *exc_info):
+        try:
+            return super().__exit__(*exc_info)
+        finally:
+            self.lock.release()
+
+def configure_connection(conn):
+    """Use WAL journaling and a larger page cache for faster commits"""
+    try:
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=268435456')
+        conn.execute('PRAGMA cache_size=-20000')
+    except sqlite3.Error as e:
+        # WAL needs a writable directory - fall back to the defaults
+        print(f"Could not configure SQLite pragmas: {e}")
+
+@st.cache_resource
+def get_conn(path=DB_PATH):
+    """Open the database once per process and share it across managers"""
+    conn = sqlite3.connect(path, check_same_thread=False, factory=SharedConnection)
+    configure_connection(conn)
+    return conn
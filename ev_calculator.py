@@ -20,42 +20,37 @@ def calculate_ev(prizepicks_df, market_df):
     if prizepicks_df.empty or market_df.empty:
         return pd.DataFrame()
     
-    # Merge data on player name
-    merged = pd.merge(
-        prizepicks_df, 
-        market_df, 
-        on='player',
-        how='inner'
-    )
+    # Join on a player index (market odds carry no stat_type to key on)
+    merged = prizepicks_df.set_index('player').join(
+        market_df.set_index('player'),
+        how='inner',
+        lsuffix='_x',
+        rsuffix='_y'
+    ).reset_index()
     
     if merged.empty:
         return pd.DataFrame()
     
-    # Calculate EV for each prop
-    def calculate_pick_ev(row):
-        # PrizePicks assumes 50% probability
-        pp_implied_prob = 0.5
-        
-        # Determine if Over or Under has value
-        if row['line'] < row['market_line']:
-            # PrizePicks line is lower -> Over is easier/better
-            ev = row['implied_prob'] - pp_implied_prob
-            direction = 'OVER'
-        else:
-            # PrizePicks line is higher -> Under is easier/better
-            ev = (1 - row['implied_prob']) - pp_implied_prob
-            direction = 'UNDER'
-        
-        return pd.Series({
-            'ev': round(ev, 3),
-            'direction': direction,
-            'is_positive': ev > 0,
-            'edge_amount': abs(row['line'] - row['market_line'])
-        })
+    # Calculate EV for every prop at once
+    # PrizePicks assumes 50% probability
+    pp_implied_prob = 0.5
     
-    # Apply calculation
-    results = merged.apply(calculate_pick_ev, axis=1)
-    merged = pd.concat([merged, results], axis=1)
+    # PrizePicks line lower than market -> Over is easier/better, otherwise Under
+    is_over = (merged['line'] < merged['market_line']).to_numpy()
+    implied = merged['implied_prob'].to_numpy(dtype=np.float64)
+    prob = np.where(is_over, implied, 1 - implied)
+    ev = prob - pp_implied_prob
+    
+    merged['ev'] = np.round(ev, 3)
+    merged['direction'] = np.where(is_over, 'OVER', 'UNDER')
+    merged['is_positive'] = ev > 0
+    merged['edge_amount'] = (merged['line'] - merged['market_line']).abs()
+    # Probability of the chosen side hitting, used for parlay odds
+    merged['prob'] = prob
+    
+    # Categorical keys let the stat/player filters downstream compare int codes
+    merged['player'] = merged['player'].astype('category')
+    merged['stat_type'] = merged['stat_type'].astype('category')
     
     # Sort by EV (best first)
     merged = merged.sort_values('ev', ascending=False)
@@ -76,12 +71,11 @@ def calculate_parlay_probability(picks_df):
     if picks_df.empty:
         return 0.0
     
-    probs = []
-    for _, pick in picks_df.iterrows():
-        if pick['direction'] == 'OVER':
-            probs.append(pick['implied_prob'])
-        else:
-            probs.append(1 - pick['implied_prob'])
+    if 'prob' in picks_df.columns:
+        probs = picks_df['prob'].to_numpy(dtype=np.float64)
+    else:
+        implied = picks_df['implied_prob'].to_numpy(dtype=np.float64)
+        probs = np.where(picks_df['direction'].to_numpy() == 'OVER', implied, 1 - implied)
     
     # Multiply all probabilities
     combined_prob = np.prod(probs)
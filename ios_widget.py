@@ -7,6 +7,51 @@ import pandas as pd
 from datetime import datetime
 import streamlit as st
 
+def build_widget_data(ev_data, pp_data):
+    """
+    Build top picks and stats for the widget (pure; an nlargest and a mean are
+    cheaper than hashing the frames for st.cache_data, so it is not cached)
+    """
+    # Get top 3 EV picks
+    if not ev_data.empty and 'ev' in ev_data.columns:
+        top_picks = ev_data.nlargest(3, 'ev')[['player', 'stat_type', 'line', 'ev']].to_dict('records')
+    else:
+        top_picks = []
+    
+    # Format for widget
+    formatted_picks = []
+    for pick in top_picks:
+        formatted_picks.append({
+            'player': pick['player'],
+            'stat': pick['stat_type'],
+            'ev': f"{pick['ev']:.1%}" if isinstance(pick['ev'], (int, float)) else "N/A",
+            'line': pick['line']
+        })
+    
+    # Calculate stats safely
+    profitable_props = 0
+    avg_ev = 0
+    
+    if not ev_data.empty:
+        if 'is_positive' in ev_data.columns:
+            profitable_props = len(ev_data[ev_data['is_positive']])
+        elif 'ev' in ev_data.columns:
+            profitable_props = len(ev_data[ev_data['ev'] > 0])
+        
+        if 'ev' in ev_data.columns:
+            avg_ev = ev_data['ev'].mean()
+    
+    stats = {
+        'total_props': len(pp_data) if pp_data is not None else 0,
+        'profitable_props': profitable_props,
+        'avg_ev': avg_ev if avg_ev else 0
+    }
+    
+    return {
+        'top_picks': formatted_picks,
+        'stats': stats
+    }
+
 class iOSWidget:
     def __init__(self):
         self.widget_data = {
@@ -19,49 +64,21 @@ class iOSWidget:
         """
         Generate data for iOS widget display
         """
-        # Get top 3 EV picks
-        if not ev_data.empty and 'ev' in ev_data.columns:
-            top_picks = ev_data.nlargest(3, 'ev')[['player', 'stat_type', 'line', 'ev']].to_dict('records')
-        else:
-            top_picks = []
-        
-        # Format for widget
-        formatted_picks = []
-        for pick in top_picks:
-            formatted_picks.append({
-                'player': pick['player'],
-                'stat': pick['stat_type'],
-                'ev': f"{pick['ev']:.1%}" if isinstance(pick['ev'], (int, float)) else "N/A",
-                'line': pick['line']
-            })
-        
-        # Calculate stats safely
-        profitable_props = 0
-        avg_ev = 0
+        content = build_widget_data(ev_data, pp_data)
         
-        if not ev_data.empty:
-            if 'is_positive' in ev_data.columns:
-                profitable_props = len(ev_data[ev_data['is_positive']])
-            elif 'ev' in ev_data.columns:
-                profitable_props = len(ev_data[ev_data['ev'] > 0])
-            
-            if 'ev' in ev_data.columns:
-                avg_ev = ev_data['ev'].mean()
-        
-        stats = {
-            'total_props': len(pp_data) if pp_data is not None else 0,
-            'profitable_props': profitable_props,
-            'avg_ev': avg_ev if avg_ev else 0
-        }
+        # Only rewrite the widget file when the picks/stats actually change
+        content_hash = hash(json.dumps(content, sort_keys=True, default=str))
+        if st.session_state.get('last_widget_hash') == content_hash:
+            return self.widget_data
         
         self.widget_data = {
-            'top_picks': formatted_picks,
-            'stats': stats,
+            **content,
             'last_updated': datetime.now().isoformat()
         }
         
         # Save to file for widget to read
         self.save_widget_data()
+        st.session_state['last_widget_hash'] = content_hash
         
         return self.widget_data
     
@@ -88,7 +105,8 @@ class iOSWidget:
         """
         Render a preview of how the widget will look on iOS
         """
-        data = self.get_widget_data()
+        # Data generated this run is already in memory; only fall back to the file otherwise
+        data = self.widget_data if self.widget_data.get('last_updated') else self.get_widget_data()
         
         # Ensure stats has all required keys
         if 'stats' not in data:
@@ -0,0 +1,156 @@
+"""
+iPad Styles - Static CSS for the Streamlit app
+Kept in its own module so the string is built once per process, not on every rerun
+"""
+
+import re
+
+def _minify(css):
+    """Strip comments and collapse whitespace so less is sent over the websocket each rerun"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};,>])\s*", r"\1", css).strip()
+
+IPAD_CSS = """
+<style>
+    /* Bigger touch targets for iPad */
+    .stButton > button {
+        min-height: 55px;
+        font-size: 18px !important;
+        border-radius: 15px !important;
+        margin: 8px 0px;
+        font-weight: 600 !important;
+    }
+    
+    /* Better spacing for touch */
+    .stSelectbox, .stSlider, .stRadio {
+        margin-bottom: 25px;
+    }
+    
+    /* Make sliders easier to grab */
+    .stSlider div[data-baseweb="slider"] {
+        padding-top: 15px;
+        padding-bottom: 15px;
+    }
+    
+    .stSlider .thumb {
+        width: 28px !important;
+        height: 28px !important;
+        background-color: #FF4B4B !important;
+        border: 3px solid white !important;
+    }
+    
+    /* Card-like containers */
+    .stApp .block-container {
+        padding-left: 1.2rem;
+        padding-right: 1.2rem;
+        padding-top: 1.5rem;
+    }
+    
+    /* Metric cards */
+    div[data-testid="stMetric"] {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        border-radius: 20px;
+        padding: 20px 15px;
+        box-shadow: 0 6px 12px rgba(0,0,0,0.1);
+        margin: 10px 0px;
+    }
+    
+    div[data-testid="stMetric"] label {
+        color: rgba(255,255,255,0.9) !important;
+        font-size: 16px !important;
+        font-weight: 500 !important;
+    }
+    
+    div[data-testid="stMetric"] div[data-testid="stMetricValue"] {
+        color: white !important;
+        font-size: 36px !important;
+        font-weight: 700 !important;
+        line-height: 1.2 !important;
+    }
+    
+    /* Data tables */
+    .stDataFrame {
+        font-size: 15px;
+    }
+    
+    .stDataFrame div[data-testid="stDataFrame"] {
+        max-height: 450px;
+        overflow-y: auto;
+        -webkit-overflow-scrolling: touch;
+        border-radius: 15px;
+        border: 1px solid #e0e0e0;
+    }
+    
+    /* Bottom padding */
+    .main > div {
+        padding-bottom: 120px;
+    }
+    
+    /* Hide hamburger menu */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    
+    /* Tabs styling */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 8px;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        border-radius: 15px 15px 0 0;
+        padding: 15px 25px;
+        font-size: 16px;
+        font-weight: 600;
+    }
+    
+    /* Risk badges */
+    .risk-high {
+        background-color: #ff4444;
+        color: white;
+        padding: 4px 8px;
+        border-radius: 12px;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    
+    .risk-medium {
+        background-color: #ff8800;
+        color: white;
+        padding: 4px 8px;
+        border-radius: 12px;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    
+    .risk-low {
+        background-color: #ffbb33;
+        color: black;
+        padding: 4px 8px;
+        border-radius: 12px;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    
+    /* Share button styling */
+    .share-box {
+        background-color: #f0f2f6;
+        border-radius: 10px;
+        padding: 15px;
+        margin: 10px 0px;
+        font-family: monospace;
+    }
+</style>
+"""
+
+# Dark theme overrides; only emitted while the sidebar toggle is on
+DARK_CSS = """
+<style>
+    .stApp, .main > div { background-color: #0e1117; color: #ffffff; }
+    h1, h2, h3, p, li { color: #ffffff !important; }
+    section[data-testid="stSidebar"] { background-color: #1a1f2c !important; }
+    .stMarkdown, .stCaption { color: #e0e0e0 !important; }
+</style>
+"""
+
+IPAD_CSS = _minify(IPAD_CSS)
+DARK_CSS = _minify(DARK_CSS)
@@ -2,12 +2,9 @@
 AI Predictions Module - Machine Learning model for prop success prediction
 """
 
+import os
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-import joblib
 import streamlit as st
 from datetime import datetime, timedelta
 import requests
@@ -15,7 +12,7 @@ import requests
 class MLPredictor:
     def __init__(self):
         self.model = None
-        self.scaler = StandardScaler()
+        self.scaler = None
         self.feature_columns = [
             'avg_points_last_5', 'avg_rebounds_last_5', 'avg_assists_last_5',
             'fg_percentage', 'minutes_played', 'opponent_defense_rating',
@@ -26,7 +23,12 @@ class MLPredictor:
     
     def load_model(self):
         """Load trained model if exists"""
+        # No saved model means no reason to pay the scikit-learn import at startup
+        if not os.path.exists('prop_predictor_model.pkl'):
+            return
+        
         try:
+            import joblib
             self.model = joblib.load('prop_predictor_model.pkl')
             self.scaler = joblib.load('scaler.pkl')
         except:
@@ -40,6 +42,12 @@ class MLPredictor:
         if len(historical_data) < 100:
             return False
         
+        # scikit-learn is only imported once a model is actually trained
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import StandardScaler
+        import joblib
+        
         # Prepare features and target
         X = historical_data[self.feature_columns]
         y = historical_data['result']  # 1 for success, 0 for failure
@@ -50,6 +58,7 @@ class MLPredictor:
         )
         
         # Scale features
+        self.scaler = StandardScaler()
         X_train_scaled = self.scaler.fit_transform(X_train)
         X_test_scaled = self.scaler.transform(X_test)
         
@@ -4,8 +4,6 @@ Public Leaderboard Module - Compete with other users
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import sqlite3
 import numpy as np
@@ -112,14 +112,14 @@ class PushNotificationManager:
         
         for token, user_id in results:
             self.send_onesignal_notification(token, title, message, data)
-            
-            # Log notification
-            cursor.execute('''
+        
+        # Log notifications in one batch
+        payload = json.dumps(data) if data else None
+        with self.conn:
+            self.conn.executemany('''
                 INSERT INTO notification_history (user_id, title, message, data)
                 VALUES (?, ?, ?, ?)
-            ''', (user_id, title, message, json.dumps(data) if data else None))
-        
-        self.conn.commit()
+            ''', [(user_id, title, message, payload) for _, user_id in results])
     
     def send_onesignal_notification(self, device_token, title, message, data=None):
         """
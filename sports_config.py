@@ -32,6 +32,10 @@ SPORT_DISPLAY_NAMES = {
     "UFC": "🥊 UFC MMA",
 }
 
+# Dropdown order and labels, built once at import
+SPORT_KEYS = tuple(SPORT_DISPLAY_NAMES)
+SPORT_LABELS = tuple(SPORT_DISPLAY_NAMES.values())
+
 # Stat Types by Sport
 SPORT_STATS = {
     "NBA": ["Points", "Rebounds", "Assists", "PRA", "3PM", "BLK", "STL", "TO"],
@@ -45,6 +49,9 @@ SPORT_STATS = {
     "UFC": ["Sig Strikes", "Takedowns", "Knockdowns", "Fight Time"],
 }
 
+# Fallback stat types for sports not listed above
+DEFAULT_STATS = ("Points", "Rebounds", "Assists")
+
 # The Odds API Market Mappings
 ODDS_API_MARKETS = {
     "NBA": "player_points,player_rebounds,player_assists,player_threes,player_blocks,player_steals",
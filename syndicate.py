@@ -9,7 +9,6 @@ from datetime import datetime, timedelta
 import uuid
 import json
 import plotly.graph_objects as go
-import plotly.express as px
 
 class SyndicateManager:
     def __init__(self, multi_user_manager):
@@ -545,6 +544,7 @@ class SyndicateManager:
                     
                     daily_stats = picks_df.groupby('date').size().reset_index(name='count')
                     
+                    import plotly.express as px
                     fig = px.bar(daily_stats, x='date', y='count', 
                                 title='Daily Pick Activity')
                     st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,35 @@
+"""
+UI Helpers - Shared Streamlit display utilities
+"""
+
+import math
+import streamlit as st
+
+def display_large_dataframe(df, page_size=50, key_prefix="df", **kwargs):
+    """
+    Show a dataframe one page at a time so only that page is serialized
+    
+    Args:
+        df: DataFrame to display
+        page_size: Rows per page
+        key_prefix: Unique prefix for the page selector widget
+        **kwargs: Passed through to st.dataframe
+    """
+    n_pages = max(1, math.ceil(len(df) / page_size))
+    
+    page = 1
+    if n_pages > 1:
+        page = st.number_input(
+            f"Page (of {n_pages})",
+            min_value=1,
+            max_value=n_pages,
+            value=1,
+            step=1,
+            key=f"{key_prefix}_page"
+        )
+    
+    start = (page - 1) * page_size
+    st.dataframe(df.iloc[start:start + page_size], **kwargs)
+    
+    if n_pages > 1:
+        st.caption(f"Showing rows {start + 1}-{min(start + page_size, len(df))} of {len(df)}")